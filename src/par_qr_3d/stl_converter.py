@@ -26,12 +26,14 @@ The different approaches are necessary because:
 
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
 import numpy as np
 from PIL import Image
-from stl import mesh  # type: ignore[import-untyped]
+from stl import Mode, mesh  # type: ignore[import-untyped]
 
 try:
     import lib3mf
@@ -55,6 +57,21 @@ from .utils import (
 
 logger = get_logger(__name__)
 
+# Minimum face count before the STL fill sections are dispatched to a thread
+# pool; below this the vectorized fills finish faster than the pool starts up
+_PARALLEL_FILL_MIN_FACES = 10_000
+
+
+@lru_cache(maxsize=1)
+def _get_lib3mf_wrapper() -> Any:
+    """Return the lib3mf wrapper, initializing it once per process.
+
+    get_wrapper() loads the lib3mf shared library; caching the instance
+    amortizes that setup across batch exports so each call only pays for
+    CreateModel.
+    """
+    return get_wrapper()
+
 
 def image_to_3d_array(
     image: Image.Image,
@@ -76,24 +93,22 @@ def image_to_3d_array(
     # Convert to grayscale if needed
     image = ensure_grayscale(image)
 
-    # Convert to numpy array
-    img_array = np.array(image)
+    # Convert to a float32 array and normalize to 0-1 in place; the mesh is
+    # float32 anyway, so staying in float32 halves the memory traffic and the
+    # in-place ops avoid allocating a temporary per arithmetic step
+    height_map = np.array(image, dtype=np.float32)
+    height_map *= np.float32(1.0 / 255.0)
 
-    # Normalize to 0-1
-    img_array = img_array / 255.0
-
-    # Invert if requested
-    if invert:
-        img_array = 1.0 - img_array
-
-    # Create height map
+    # Create the height map with the one buffer already allocated
     # All areas have at least base_height (solid base plate)
     # Black pixels (0) get additional qr_height on top of base
     # White pixels (1) stay at base height
     # This creates a solid base with QR pattern extruded on top
-    height_map = np.full_like(img_array, base_height, dtype=float)
-    # Add QR height to black areas (where img_array is 0)
-    height_map = height_map + (1.0 - img_array) * qr_height
+    # Inverting flips which end is raised, which simply skips the 1-x step
+    if not invert:
+        np.subtract(np.float32(1.0), height_map, out=height_map)
+    height_map *= np.float32(qr_height)
+    height_map += np.float32(base_height)
 
     return height_map
 
@@ -118,26 +133,23 @@ def image_to_multilayer_3d_array(
     # Convert to grayscale if needed
     image = ensure_grayscale(image)
 
-    # Convert to numpy array
-    img_array = np.array(image)
+    # Keep the pixel data as uint8; the masks only need a threshold compare,
+    # so converting to float here would just copy the buffer at 4x the size
+    img_array = np.asarray(image)
     height, width = img_array.shape
 
-    # Normalize to 0-255 range
-    img_array = img_array.astype(float)
-
-    # Create height map starting with base height
-    height_map = np.full_like(img_array, layer_heights[0], dtype=float)
+    # Create height map starting with base height - float32 to match the
+    # rest of the mesh pipeline
+    height_map = np.full(img_array.shape, layer_heights[0], dtype=np.float32)
 
     if has_frame and len(layer_heights) >= 3:
         # For frames, we need a more sophisticated approach
         # The frame is typically added as a border around the QR code
         # We'll detect it by looking for connected black regions from the edges
 
-        # Normalize to 0-1 range
-        img_normalized = img_array / 255.0
-
-        # First, identify all black pixels
-        black_mask = img_normalized < 0.5
+        # First, identify all black pixels (128 is the midpoint of 0-255,
+        # matching the former normalized < 0.5 test exactly)
+        black_mask = img_array < 128
 
         # Import scipy for connected component analysis
         from scipy import ndimage
@@ -156,34 +168,52 @@ def image_to_multilayer_3d_array(
         # Find black pixels on edges
         edge_black = edge_mask & black_mask
 
+        frame_found = False
         if np.any(edge_black):
+            # Fast path: the common frame is a plain rectangular border. A
+            # uniform all-black ring with nothing black touching its inner
+            # boundary is the frame by construction, so the expensive
+            # connected-component labeling can be skipped entirely
+            full_rows = black_mask.all(axis=1)
+            full_cols = black_mask.all(axis=0)
+            thickness = int(np.argmin(full_rows))  # leading run of fully-black rows
+            if (
+                0 < thickness
+                and 2 * thickness < min(height, width)
+                and thickness == int(np.argmin(full_rows[::-1]))
+                and thickness == int(np.argmin(full_cols))
+                and thickness == int(np.argmin(full_cols[::-1]))
+            ):
+                inner = black_mask[thickness : height - thickness, thickness : width - thickness]
+                if not (inner[0, :].any() or inner[-1, :].any() or inner[:, 0].any() or inner[:, -1].any()):
+                    frame_mask[:thickness, :] = True
+                    frame_mask[-thickness:, :] = True
+                    frame_mask[:, :thickness] = True
+                    frame_mask[:, -thickness:] = True
+                    frame_found = True
+
+        if np.any(edge_black) and not frame_found:
             # Label all black connected components
             structure = np.ones((3, 3), dtype=bool)  # 8-connectivity
             labeled, num_features = ndimage.label(black_mask, structure=structure)  # type: ignore[misc]
 
-            # Get labels of components touching edges
-            edge_labels = np.unique(labeled[edge_black])
-            edge_labels = edge_labels[edge_labels != 0]  # Remove background label
-
-            # Create frame mask from edge-connected components
-            for label in edge_labels:
-                component_mask = labeled == label
-                # Check if this component forms a frame-like structure
-                # (touches multiple edges and forms a border)
-                touches_top = np.any(component_mask[0, :])
-                touches_bottom = np.any(component_mask[-1, :])
-                touches_left = np.any(component_mask[:, 0])
-                touches_right = np.any(component_mask[:, -1])
-
-                # A frame should touch at least 3 edges or form a continuous border
-                edge_count = touches_top + touches_bottom + touches_left + touches_right
-                if edge_count >= 3:
-                    # Additional check: frame components should be relatively large
-                    component_size = np.sum(component_mask)
-                    total_black = np.sum(black_mask)
-                    # Frame should be at least 10% of black pixels
-                    if component_size > 0.1 * total_black:
-                        frame_mask |= component_mask
+            # Count how many image edges each component touches, one
+            # vectorized pass per edge instead of rebuilding a mask per label
+            edge_touches = np.zeros(num_features + 1, dtype=np.int64)
+            for border_labels in (labeled[0, :], labeled[-1, :], labeled[:, 0], labeled[:, -1]):
+                touched = np.zeros(num_features + 1, dtype=bool)
+                touched[np.unique(border_labels)] = True
+                edge_touches += touched
+
+            # A frame should touch at least 3 edges and be relatively large
+            # (at least 10% of all black pixels)
+            component_sizes = np.bincount(labeled.ravel(), minlength=num_features + 1)
+            total_black = component_sizes[1:].sum()
+            frame_labels = np.flatnonzero((edge_touches >= 3) & (component_sizes > 0.1 * total_black))
+            frame_labels = frame_labels[frame_labels != 0]  # Remove background label
+
+            if frame_labels.size:
+                frame_mask = np.isin(labeled, frame_labels)
 
         # Apply heights based on the masks
         # Frame gets the highest layer
@@ -204,15 +234,27 @@ def image_to_multilayer_3d_array(
 
     else:
         # No frame, process entire image as QR code
-        img_normalized = img_array / 255.0
+        # Black pixels get QR height, white pixels stay at base; inverting
+        # flips which side of the threshold is raised, so a single uint8
+        # compare replaces the old normalize / invert / threshold passes
+        raised_mask = (img_array >= 128) if invert else (img_array < 128)
+        height_map = np.where(raised_mask, np.float32(layer_heights[1]), np.float32(layer_heights[0]))
 
-        if invert:
-            img_normalized = 1.0 - img_normalized
+    return height_map
 
-        # Black pixels (0) get QR height, white pixels stay at base
-        height_map = np.where(img_normalized < 0.5, layer_heights[1], layer_heights[0])
 
-    return height_map
+def _compute_pixel_size(shape: tuple[int, ...], base_size_mm: tuple[float, float]) -> float:
+    """Compute the uniform pixel size that maps a height map onto the base.
+
+    Args:
+        shape: Height map shape as (height, width) in pixels
+        base_size_mm: Desired base size in mm (width, height)
+
+    Returns:
+        Uniform pixel size in mm (average of the x and y scale factors)
+    """
+    img_height, img_width = shape[0], shape[1]
+    return (base_size_mm[0] / img_width + base_size_mm[1] / img_height) / 2
 
 
 def create_stl_from_heightmap(
@@ -222,6 +264,7 @@ def create_stl_from_heightmap(
     hole_diameter: float = 4.0,
     validate_and_repair: bool = True,
     debug_path: Path | str | None = None,
+    flip_vertical: bool = False,
 ) -> Any:
     """Create an STL mesh from a height map.
 
@@ -232,34 +275,74 @@ def create_stl_from_heightmap(
         hole_diameter: Diameter of mounting holes in mm
         validate_and_repair: If True, validate and repair the mesh
         debug_path: If provided, save debug visualization to this path
+        flip_vertical: If True, flip the height map vertically before meshing
 
     Returns:
         STL Mesh object with optional mounting features
     """
-    height, width = height_map.shape
-
-    # We need to count faces more carefully
-    # Top surface: 2 triangles per pixel
-    num_faces = height * width * 2
+    if flip_vertical:
+        # Negative-stride view - the flip fuses with the first read of the
+        # height map below instead of costing its own pass
+        height_map = height_map[::-1]
 
-    # Bottom surface: 2 triangles for entire base
-    num_faces += 2
-
-    # Outer walls: 2 triangles per edge pixel
-    num_faces += 2 * (2 * height + 2 * width)
+    height, width = height_map.shape
 
     # Internal walls: We need walls at every height transition
-    # Count transitions between adjacent pixels
-    for y in range(height):
-        for x in range(width):
-            curr_height = height_map[y, x]
-            # Check right neighbor
-            if x < width - 1 and height_map[y, x + 1] != curr_height:
-                num_faces += 2  # Two triangles for vertical wall
-            # Check bottom neighbor
-            if y < height - 1 and height_map[y + 1, x] != curr_height:
-                num_faces += 2  # Two triangles for vertical wall
-
+    # For the common binary case (base vs raised QR modules) the transitions
+    # are exactly the boundary edges of the raised region, so find them with
+    # two vectorized comparisons instead of scanning every neighbor pair
+    right_transitions = height_map[:, :-1] != height_map[:, 1:]
+    bottom_transitions = height_map[:-1, :] != height_map[1:, :]
+
+    # Top surface: run-length merge each row into constant-height spans so a
+    # QR module becomes one rectangle instead of module_size^2 pixel quads.
+    # A new run starts at x=0 and after every horizontal transition, so the
+    # run table falls out of the same mask used for the internal walls
+    run_starts = np.zeros((height, width), dtype=bool)
+    run_starts[:, 0] = True
+    run_starts[:, 1:] = right_transitions
+    run_ys, run_x0 = np.nonzero(run_starts)
+    # Each run ends where the next one begins (or at the row's right edge)
+    run_x1 = np.empty_like(run_x0)
+    run_x1[:-1] = run_x0[1:]
+    run_x1[-1] = width
+    run_x1[:-1][run_ys[1:] != run_ys[:-1]] = width
+
+    # Each mesh section writes a disjoint, precomputed slice of
+    # stl_mesh.vectors, so the sections can be filled independently
+    # Top surface: 2 triangles per merged run
+    num_top_faces = 2 * len(run_ys)
+    num_right_walls = 2 * np.count_nonzero(right_transitions)
+    num_bottom_walls = 2 * np.count_nonzero(bottom_transitions)
+
+    def edge_runs(edge: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        """Split a border row/column into constant-height runs.
+
+        Args:
+            edge: 1D array of heights along one border of the height map
+
+        Returns:
+            Tuple of (run start indices, run end indices)
+        """
+        breaks = np.flatnonzero(edge[1:] != edge[:-1]) + 1
+        return np.concatenate(([0], breaks)), np.concatenate((breaks, [len(edge)]))
+
+    # Outer walls: contiguous equal-height edge pixels collapse into one
+    # rectangular wall quad per run instead of two triangles per pixel
+    front_runs = edge_runs(height_map[0, :])
+    back_runs = edge_runs(height_map[height - 1, :])
+    left_runs = edge_runs(height_map[:, 0])
+    right_runs = edge_runs(height_map[:, width - 1])
+    num_outer_walls = 2 * (len(front_runs[0]) + len(back_runs[0]) + len(left_runs[0]) + len(right_runs[0]))
+
+    right_wall_start = num_top_faces
+    bottom_wall_start = right_wall_start + num_right_walls
+    outer_wall_start = bottom_wall_start + num_bottom_walls
+    # Outer walls, then 2 triangles for the base
+    base_start = outer_wall_start + num_outer_walls
+    mount_start = base_start + 2
+
+    num_faces = mount_start
     # Add faces for mounting features
     if mount_type == "keychain":
         # The keychain mount has 48 triangles
@@ -268,163 +351,282 @@ def create_stl_from_heightmap(
     # Create mesh
     stl_mesh: Any = mesh.Mesh(np.zeros(num_faces, dtype=mesh.Mesh.dtype))
 
-    face_idx = 0
-
-    # Create top surface
-    for y in range(height):
-        for x in range(width):
-            # Get the four corners of this pixel
-            x0, y0 = x * pixel_size, y * pixel_size
-            x1, y1 = (x + 1) * pixel_size, (y + 1) * pixel_size
-
-            # Height for this pixel
-            h = height_map[y, x]
-
-            # First triangle
-            stl_mesh.vectors[face_idx] = np.array([[x0, y0, h], [x1, y0, h], [x0, y1, h]])
-            face_idx += 1
-
-            # Second triangle
-            stl_mesh.vectors[face_idx] = np.array([[x1, y0, h], [x1, y1, h], [x0, y1, h]])
-            face_idx += 1
-
-    # Create internal walls at height transitions
-    for y in range(height):
-        for x in range(width):
-            x0, y0 = x * pixel_size, y * pixel_size
-            x1, y1 = (x + 1) * pixel_size, (y + 1) * pixel_size
-            curr_height = height_map[y, x]
-
-            # Check right neighbor - create vertical wall if heights differ
-            if x < width - 1:
-                right_height = height_map[y, x + 1]
-                if curr_height != right_height:
-                    # Create wall between current and right pixel
-                    # Wall goes from min height to max height
-                    min_h = min(curr_height, right_height)
-                    max_h = max(curr_height, right_height)
-
-                    # Two triangles forming a vertical rectangle
-                    if curr_height > right_height:
-                        # Current is higher, normal points left
-                        stl_mesh.vectors[face_idx] = np.array([[x1, y0, min_h], [x1, y1, min_h], [x1, y0, max_h]])
-                        face_idx += 1
-
-                        stl_mesh.vectors[face_idx] = np.array([[x1, y1, min_h], [x1, y1, max_h], [x1, y0, max_h]])
-                        face_idx += 1
-                    else:
-                        # Right is higher, normal points right
-                        stl_mesh.vectors[face_idx] = np.array([[x1, y0, min_h], [x1, y0, max_h], [x1, y1, min_h]])
-                        face_idx += 1
-
-                        stl_mesh.vectors[face_idx] = np.array([[x1, y0, max_h], [x1, y1, max_h], [x1, y1, min_h]])
-                        face_idx += 1
-
-            # Check bottom neighbor - create vertical wall if heights differ
-            if y < height - 1:
-                bottom_height = height_map[y + 1, x]
-                if curr_height != bottom_height:
-                    # Create wall between current and bottom pixel
-                    # Wall goes from min height to max height
-                    min_h = min(curr_height, bottom_height)
-                    max_h = max(curr_height, bottom_height)
-
-                    # Two triangles forming a vertical rectangle
-                    if curr_height > bottom_height:
-                        # Current is higher, normal points up
-                        stl_mesh.vectors[face_idx] = np.array([[x0, y1, min_h], [x1, y1, min_h], [x0, y1, max_h]])
-                        face_idx += 1
-
-                        stl_mesh.vectors[face_idx] = np.array([[x1, y1, min_h], [x1, y1, max_h], [x0, y1, max_h]])
-                        face_idx += 1
-                    else:
-                        # Bottom is higher, normal points down
-                        stl_mesh.vectors[face_idx] = np.array([[x0, y1, min_h], [x0, y1, max_h], [x1, y1, min_h]])
-                        face_idx += 1
-
-                        stl_mesh.vectors[face_idx] = np.array([[x0, y1, max_h], [x1, y1, max_h], [x1, y1, min_h]])
-                        face_idx += 1
-
-    # Create outer walls
     total_width = width * pixel_size
     total_height = height * pixel_size
 
-    # Front side (y=0)
-    for x in range(width):
-        x0, x1 = x * pixel_size, (x + 1) * pixel_size
-        h = height_map[0, x]
-
-        # Two triangles
-        stl_mesh.vectors[face_idx] = np.array([[x0, 0, 0], [x1, 0, 0], [x0, 0, h]])
-        face_idx += 1
-        stl_mesh.vectors[face_idx] = np.array([[x1, 0, 0], [x1, 0, h], [x0, 0, h]])
-        face_idx += 1
-
-    # Back side (y=max)
-    for x in range(width):
-        x0, x1 = x * pixel_size, (x + 1) * pixel_size
-        h = height_map[height - 1, x]
-
-        # Two triangles
-        stl_mesh.vectors[face_idx] = np.array([[x0, total_height, h], [x1, total_height, h], [x0, total_height, 0]])
-        face_idx += 1
-        stl_mesh.vectors[face_idx] = np.array([[x1, total_height, h], [x1, total_height, 0], [x0, total_height, 0]])
-        face_idx += 1
-
-    # Left side (x=0)
-    for y in range(height):
-        y0, y1 = y * pixel_size, (y + 1) * pixel_size
-        h = height_map[y, 0]
-
-        # Two triangles
-        stl_mesh.vectors[face_idx] = np.array([[0, y0, h], [0, y1, h], [0, y0, 0]])
+    def fill_top_surface() -> float:
+        """Fill the top surface section and return the maximum height seen."""
+        # Run corner coordinates, computed in float64 so they round to
+        # float32 exactly like the arithmetic used for the wall sections
+        x0 = run_x0 * np.float64(pixel_size)
+        x1 = run_x1 * np.float64(pixel_size)
+        y0 = run_ys * np.float64(pixel_size)
+        y1 = y0 + pixel_size
+        h = height_map[run_ys, run_x0]
+
+        # Build both triangles of every run in one vectorized pass:
+        # first triangle (x0,y0) (x1,y0) (x0,y1), second (x1,y0) (x1,y1) (x0,y1)
+        tri = np.empty((len(run_ys), 2, 3, 3), dtype=np.float32)
+        tri[:, 0, 0, 0] = x0
+        tri[:, 0, 0, 1] = y0
+        tri[:, 0, 1, 0] = x1
+        tri[:, 0, 1, 1] = y0
+        tri[:, 0, 2, 0] = x0
+        tri[:, 0, 2, 1] = y1
+        tri[:, 1, 0, 0] = x1
+        tri[:, 1, 0, 1] = y0
+        tri[:, 1, 1, 0] = x1
+        tri[:, 1, 1, 1] = y1
+        tri[:, 1, 2, 0] = x0
+        tri[:, 1, 2, 1] = y1
+
+        # Every vertex of a run's top surface sits at that run's height
+        tri[..., 2] = h[:, None, None]
+
+        stl_mesh.vectors[:num_top_faces] = tri.reshape(-1, 3, 3)
+
+        # Every top face is axis-aligned, so its (area-weighted) normal is
+        # known analytically: straight up with magnitude run_width * pixel_size
+        nrm = stl_mesh.normals[:num_top_faces].reshape(-1, 2, 3)
+        nrm[..., 2] = ((x1 - x0) * pixel_size)[:, None]
+
+        # Every pixel belongs to exactly one constant-height run, so the max
+        # over the gathered run heights is the map's max - reported as an
+        # O(runs) byproduct so no np.max() pass over the height map is needed
+        return float(h.max())
+
+    def fill_right_walls() -> None:
+        """Fill vertical walls at height transitions between horizontal neighbors."""
+        ys, xs = np.nonzero(right_transitions)
+        if ys.size == 0:
+            return
+
+        # Gather both sides of every transition at once; walls span min to max
+        # height and wind so the normal faces away from the higher pixel
+        curr_h = height_map[ys, xs]
+        right_h = height_map[ys, xs + 1]
+        min_h = np.minimum(curr_h, right_h)
+        max_h = np.maximum(curr_h, right_h)
+        higher = curr_h > right_h
+
+        x1 = (xs + 1) * np.float64(pixel_size)
+        y0 = ys * np.float64(pixel_size)
+        y1 = y0 + pixel_size
+
+        walls = np.empty((ys.size, 2, 3, 3), dtype=np.float32)
+        walls[..., 0] = x1[:, None, None]
+        # First triangle: (x1,y0,min) then (x1,y1,min)/(x1,y0,max) in
+        # winding order chosen by which side is higher
+        walls[:, 0, 0, 1] = y0
+        walls[:, 0, 0, 2] = min_h
+        walls[:, 0, 1, 1] = np.where(higher, y1, y0)
+        walls[:, 0, 1, 2] = np.where(higher, min_h, max_h)
+        walls[:, 0, 2, 1] = np.where(higher, y0, y1)
+        walls[:, 0, 2, 2] = np.where(higher, max_h, min_h)
+        # Second triangle completes the rectangle through (x1,y1,max)
+        walls[:, 1, 0, 1] = np.where(higher, y1, y0)
+        walls[:, 1, 0, 2] = np.where(higher, min_h, max_h)
+        walls[:, 1, 1, 1] = y1
+        walls[:, 1, 1, 2] = max_h
+        walls[:, 1, 2, 1] = np.where(higher, y0, y1)
+        walls[:, 1, 2, 2] = np.where(higher, max_h, min_h)
+
+        stl_mesh.vectors[right_wall_start:bottom_wall_start] = walls.reshape(-1, 3, 3)
+
+        # Axis-aligned wall normals: +/-X with magnitude pixel_size * wall height
+        nrm = stl_mesh.normals[right_wall_start:bottom_wall_start].reshape(-1, 2, 3)
+        nrm[..., 0] = (np.where(higher, pixel_size, -pixel_size) * (max_h - min_h))[:, None]
+
+    def fill_bottom_walls() -> None:
+        """Fill vertical walls at height transitions between vertical neighbors."""
+        ys, xs = np.nonzero(bottom_transitions)
+        if ys.size == 0:
+            return
+
+        curr_h = height_map[ys, xs]
+        bottom_h = height_map[ys + 1, xs]
+        min_h = np.minimum(curr_h, bottom_h)
+        max_h = np.maximum(curr_h, bottom_h)
+        higher = curr_h > bottom_h
+
+        x0 = xs * np.float64(pixel_size)
+        x1 = x0 + pixel_size
+        y1 = (ys + 1) * np.float64(pixel_size)
+
+        walls = np.empty((ys.size, 2, 3, 3), dtype=np.float32)
+        walls[..., 1] = y1[:, None, None]
+        # First triangle: (x0,y1,min) then (x1,y1,min)/(x0,y1,max) in
+        # winding order chosen by which side is higher
+        walls[:, 0, 0, 0] = x0
+        walls[:, 0, 0, 2] = min_h
+        walls[:, 0, 1, 0] = np.where(higher, x1, x0)
+        walls[:, 0, 1, 2] = np.where(higher, min_h, max_h)
+        walls[:, 0, 2, 0] = np.where(higher, x0, x1)
+        walls[:, 0, 2, 2] = np.where(higher, max_h, min_h)
+        # Second triangle completes the rectangle through (x1,y1,max)
+        walls[:, 1, 0, 0] = np.where(higher, x1, x0)
+        walls[:, 1, 0, 2] = np.where(higher, min_h, max_h)
+        walls[:, 1, 1, 0] = x1
+        walls[:, 1, 1, 2] = max_h
+        walls[:, 1, 2, 0] = np.where(higher, x0, x1)
+        walls[:, 1, 2, 2] = np.where(higher, max_h, min_h)
+
+        stl_mesh.vectors[bottom_wall_start:outer_wall_start] = walls.reshape(-1, 3, 3)
+
+        # Axis-aligned wall normals: -/+Y with magnitude pixel_size * wall height
+        nrm = stl_mesh.normals[bottom_wall_start:outer_wall_start].reshape(-1, 2, 3)
+        nrm[..., 1] = (np.where(higher, -pixel_size, pixel_size) * (max_h - min_h))[:, None]
+
+    def fill_outer_walls() -> None:
+        """Fill the four outer wall strips and the solid bottom face."""
+        # Each side emits one rectangular quad per constant-height run; run
+        # coordinates stay in float64 until the float32 assignment
+        face_idx = outer_wall_start
+
+        # Front side (y=0): (x0,0,0) (x1,0,0) (x0,0,h) and (x1,0,0) (x1,0,h) (x0,0,h)
+        starts, ends = front_runs
+        h = height_map[0, starts]
+        xs0 = starts * np.float64(pixel_size)
+        xs1 = ends * np.float64(pixel_size)
+        walls = np.zeros((len(starts), 2, 3, 3), dtype=np.float32)
+        walls[:, 0, 0, 0] = xs0
+        walls[:, 0, 1, 0] = xs1
+        walls[:, 0, 2, 0] = xs0
+        walls[:, 0, 2, 2] = h
+        walls[:, 1, 0, 0] = xs1
+        walls[:, 1, 1, 0] = xs1
+        walls[:, 1, 1, 2] = h
+        walls[:, 1, 2, 0] = xs0
+        walls[:, 1, 2, 2] = h
+        stl_mesh.vectors[face_idx : face_idx + 2 * len(starts)] = walls.reshape(-1, 3, 3)
+        nrm = stl_mesh.normals[face_idx : face_idx + 2 * len(starts)].reshape(-1, 2, 3)
+        nrm[..., 1] = (-(xs1 - xs0) * h)[:, None]
+        face_idx += 2 * len(starts)
+
+        # Back side (y=max): (x0,Y,h) (x1,Y,h) (x0,Y,0) and (x1,Y,h) (x1,Y,0) (x0,Y,0)
+        starts, ends = back_runs
+        h = height_map[height - 1, starts]
+        xs0 = starts * np.float64(pixel_size)
+        xs1 = ends * np.float64(pixel_size)
+        walls = np.zeros((len(starts), 2, 3, 3), dtype=np.float32)
+        walls[..., 1] = total_height
+        walls[:, 0, 0, 0] = xs0
+        walls[:, 0, 0, 2] = h
+        walls[:, 0, 1, 0] = xs1
+        walls[:, 0, 1, 2] = h
+        walls[:, 0, 2, 0] = xs0
+        walls[:, 1, 0, 0] = xs1
+        walls[:, 1, 0, 2] = h
+        walls[:, 1, 1, 0] = xs1
+        walls[:, 1, 2, 0] = xs0
+        stl_mesh.vectors[face_idx : face_idx + 2 * len(starts)] = walls.reshape(-1, 3, 3)
+        nrm = stl_mesh.normals[face_idx : face_idx + 2 * len(starts)].reshape(-1, 2, 3)
+        nrm[..., 1] = ((xs1 - xs0) * h)[:, None]
+        face_idx += 2 * len(starts)
+
+        # Left side (x=0): (0,y0,h) (0,y1,h) (0,y0,0) and (0,y1,h) (0,y1,0) (0,y0,0)
+        starts, ends = left_runs
+        h = height_map[starts, 0]
+        ys0 = starts * np.float64(pixel_size)
+        ys1 = ends * np.float64(pixel_size)
+        walls = np.zeros((len(starts), 2, 3, 3), dtype=np.float32)
+        walls[:, 0, 0, 1] = ys0
+        walls[:, 0, 0, 2] = h
+        walls[:, 0, 1, 1] = ys1
+        walls[:, 0, 1, 2] = h
+        walls[:, 0, 2, 1] = ys0
+        walls[:, 1, 0, 1] = ys1
+        walls[:, 1, 0, 2] = h
+        walls[:, 1, 1, 1] = ys1
+        walls[:, 1, 2, 1] = ys0
+        stl_mesh.vectors[face_idx : face_idx + 2 * len(starts)] = walls.reshape(-1, 3, 3)
+        nrm = stl_mesh.normals[face_idx : face_idx + 2 * len(starts)].reshape(-1, 2, 3)
+        nrm[..., 0] = (-(ys1 - ys0) * h)[:, None]
+        face_idx += 2 * len(starts)
+
+        # Right side (x=max): (X,y0,0) (X,y1,0) (X,y0,h) and (X,y1,0) (X,y1,h) (X,y0,h)
+        starts, ends = right_runs
+        h = height_map[starts, width - 1]
+        ys0 = starts * np.float64(pixel_size)
+        ys1 = ends * np.float64(pixel_size)
+        walls = np.zeros((len(starts), 2, 3, 3), dtype=np.float32)
+        walls[..., 0] = total_width
+        walls[:, 0, 0, 1] = ys0
+        walls[:, 0, 1, 1] = ys1
+        walls[:, 0, 2, 1] = ys0
+        walls[:, 0, 2, 2] = h
+        walls[:, 1, 0, 1] = ys1
+        walls[:, 1, 1, 1] = ys1
+        walls[:, 1, 1, 2] = h
+        walls[:, 1, 2, 1] = ys0
+        walls[:, 1, 2, 2] = h
+        stl_mesh.vectors[face_idx : face_idx + 2 * len(starts)] = walls.reshape(-1, 3, 3)
+        nrm = stl_mesh.normals[face_idx : face_idx + 2 * len(starts)].reshape(-1, 2, 3)
+        nrm[..., 0] = ((ys1 - ys0) * h)[:, None]
+        face_idx += 2 * len(starts)
+
+        # Bottom face - solid base covering entire area
+        stl_mesh.vectors[face_idx] = np.array([[0, 0, 0], [total_width, 0, 0], [0, total_height, 0]])
         face_idx += 1
-        stl_mesh.vectors[face_idx] = np.array([[0, y1, h], [0, y1, 0], [0, y0, 0]])
-        face_idx += 1
-
-    # Right side (x=max)
-    for y in range(height):
-        y0, y1 = y * pixel_size, (y + 1) * pixel_size
-        h = height_map[y, width - 1]
-
-        # Two triangles
-        stl_mesh.vectors[face_idx] = np.array([[total_width, y0, 0], [total_width, y1, 0], [total_width, y0, h]])
-        face_idx += 1
-        stl_mesh.vectors[face_idx] = np.array([[total_width, y1, 0], [total_width, y1, h], [total_width, y0, h]])
-        face_idx += 1
-
-    # Bottom face - solid base covering entire area
-    stl_mesh.vectors[face_idx] = np.array([[0, 0, 0], [total_width, 0, 0], [0, total_height, 0]])
-    face_idx += 1
-    stl_mesh.vectors[face_idx] = np.array([[total_width, 0, 0], [total_width, total_height, 0], [0, total_height, 0]])
-    face_idx += 1
+        stl_mesh.vectors[face_idx] = np.array(
+            [[total_width, 0, 0], [total_width, total_height, 0], [0, total_height, 0]]
+        )
+        stl_mesh.normals[base_start:mount_start, 2] = total_width * total_height
+
+    # Fill the independent sections in parallel - each one writes its own
+    # disjoint slice of stl_mesh.vectors. Small meshes run inline, where the
+    # thread pool startup would cost more than it saves
+    if num_faces > _PARALLEL_FILL_MIN_FACES:
+        with ThreadPoolExecutor() as executor:
+            top_future = executor.submit(fill_top_surface)
+            wall_futures = [
+                executor.submit(fill_right_walls),
+                executor.submit(fill_bottom_walls),
+                executor.submit(fill_outer_walls),
+            ]
+            max_height = top_future.result()
+            for future in wall_futures:
+                future.result()
+    else:
+        max_height = fill_top_surface()
+        fill_right_walls()
+        fill_bottom_walls()
+        fill_outer_walls()
 
     # Add mounting features if requested
     if mount_type == "keychain":
-        # Get the maximum height of the model
-        max_height = np.max(height_map)
-        face_idx = add_keychain_mount(
+        # Maximum height was tracked during top surface generation
+        add_keychain_mount(
             stl_mesh,
-            face_idx,
+            mount_start,
             total_width,
             total_height,
             max_height,
             hole_diameter,
         )
+        # The mount is the only section with non-axis-aligned faces, so it is
+        # the only one whose normals need an actual cross product
+        mount_vectors = stl_mesh.vectors[mount_start:]
+        stl_mesh.normals[mount_start:] = np.cross(
+            mount_vectors[:, 1] - mount_vectors[:, 0], mount_vectors[:, 2] - mount_vectors[:, 0]
+        )
 
-    # Update normals
-    stl_mesh.update_normals()
+    # Normals for every other section were set analytically as the sections
+    # were emitted, so no update_normals() pass over the whole mesh is needed
 
-    logger.info(f"Created STL mesh with {face_idx} faces")
+    logger.info(f"Created STL mesh with {num_faces} faces")
 
     # Validate and repair if requested
     if validate_and_repair:
         logger.debug("Validating mesh...")
 
-        # Convert numpy-stl mesh to trimesh for validation
+        # Convert numpy-stl mesh to trimesh for validation, deduplicating the
+        # per-face vertex copies first so trimesh gets a compact indexed mesh
+        # instead of having to merge ~6x redundant vertices itself
         vertices = stl_mesh.vectors.reshape(-1, 3)
-        faces = np.arange(len(vertices)).reshape(-1, 3)
-        trimesh_obj = numpy_mesh_to_trimesh(vertices, faces)
+        unique_vertices, inverse = np.unique(vertices, axis=0, return_inverse=True)
+        faces = inverse.reshape(-1, 3)
+        trimesh_obj = numpy_mesh_to_trimesh(unique_vertices, faces)
 
         # Validate mesh
         validation_results = validate_mesh(trimesh_obj, verbose=False)
@@ -463,6 +665,87 @@ def create_stl_from_heightmap(
     return stl_mesh
 
 
+# Triangle winding for an axis-aligned box with the standard vertex order
+# (bottom face corners 0-3, top face corners 4-7), 2 triangles per face.
+# Shared by every box emission path so it is only built once.
+# Faces are ordered so consecutive triangles share vertices (each face reuses
+# an edge of the previous one), which keeps recently transformed vertices in
+# the consumer's vertex cache
+_BOX_TRIANGLES: list[tuple[int, int, int]] = [
+    # Bottom face
+    (0, 2, 1),
+    (0, 3, 2),
+    # Front face (shares edge 0-1 with bottom)
+    (0, 1, 5),
+    (0, 5, 4),
+    # Right face (shares edge 1-5 with front)
+    (1, 2, 6),
+    (1, 6, 5),
+    # Top face (shares edge 5-6 with right)
+    (4, 5, 6),
+    (4, 6, 7),
+    # Back face (shares edge 6-7 with top)
+    (3, 7, 6),
+    (3, 6, 2),
+    # Left face (shares edge 3-7 with back)
+    (0, 4, 7),
+    (0, 7, 3),
+]
+
+
+# Unit-cube corner template shared by the box geometry helpers; scaling and
+# offsetting this is cheaper than rebuilding the corner list per call
+_BOX_CORNERS: np.ndarray = np.array(
+    [
+        [0, 0, 0],  # 0: bottom-left-bottom
+        [1, 0, 0],  # 1: bottom-right-bottom
+        [1, 1, 0],  # 2: top-right-bottom
+        [0, 1, 0],  # 3: top-left-bottom
+        [0, 0, 1],  # 4: bottom-left-top
+        [1, 0, 1],  # 5: bottom-right-top
+        [1, 1, 1],  # 6: top-right-top
+        [0, 1, 1],  # 7: top-left-top
+    ],
+    dtype=np.float64,
+)
+
+# Face triangles for the standalone box helpers, ordered bottom pair, top
+# pair, then the four sides; the partial variants slice out what they omit
+_BOX_FACES: list[tuple[int, int, int]] = [
+    # Bottom face
+    (0, 2, 1),
+    (0, 3, 2),
+    # Top face
+    (4, 5, 6),
+    (4, 6, 7),
+    # Front face
+    (0, 1, 5),
+    (0, 5, 4),
+    # Back face
+    (3, 7, 6),
+    (3, 6, 2),
+    # Left face
+    (0, 4, 7),
+    (0, 7, 3),
+    # Right face
+    (1, 2, 6),
+    (1, 6, 5),
+]
+
+
+def _box_vertices(x0: float, y0: float, z0: float, x1: float, y1: float, z1: float) -> list[list[float]]:
+    """Scale and offset the unit-cube corner template to the given extents.
+
+    Args:
+        x0, y0, z0: Minimum coordinates
+        x1, y1, z1: Maximum coordinates
+
+    Returns:
+        List of 8 [x, y, z] corner coordinates
+    """
+    return (_BOX_CORNERS * [x1 - x0, y1 - y0, z1 - z0] + [x0, y0, z0]).tolist()
+
+
 def generate_box_geometry(
     x0: float, y0: float, z0: float, x1: float, y1: float, z1: float
 ) -> tuple[list[list[float]], list[tuple[int, int, int]]]:
@@ -477,39 +760,7 @@ def generate_box_geometry(
         - vertices is a list of [x, y, z] coordinates
         - triangles is a list of (v0, v1, v2) vertex indices
     """
-    vertices = [
-        [x0, y0, z0],  # 0: bottom-left-bottom
-        [x1, y0, z0],  # 1: bottom-right-bottom
-        [x1, y1, z0],  # 2: top-right-bottom
-        [x0, y1, z0],  # 3: top-left-bottom
-        [x0, y0, z1],  # 4: bottom-left-top
-        [x1, y0, z1],  # 5: bottom-right-top
-        [x1, y1, z1],  # 6: top-right-top
-        [x0, y1, z1],  # 7: top-left-top
-    ]
-
-    triangles = [
-        # Bottom face
-        (0, 2, 1),
-        (0, 3, 2),
-        # Top face
-        (4, 5, 6),
-        (4, 6, 7),
-        # Front face
-        (0, 1, 5),
-        (0, 5, 4),
-        # Back face
-        (3, 7, 6),
-        (3, 6, 2),
-        # Left face
-        (0, 4, 7),
-        (0, 7, 3),
-        # Right face
-        (1, 2, 6),
-        (1, 6, 5),
-    ]
-
-    return vertices, triangles
+    return _box_vertices(x0, y0, z0, x1, y1, z1), list(_BOX_FACES)
 
 
 def generate_box_geometry_no_bottom(
@@ -517,6 +768,8 @@ def generate_box_geometry_no_bottom(
 ) -> tuple[list[list[float]], list[tuple[int, int, int]]]:
     """Generate vertices and triangles for a 3D box without bottom face.
 
+    The bottom face is omitted because the box sits on the base plate.
+
     Args:
         x0, y0, z0: Minimum coordinates
         x1, y1, z1: Maximum coordinates
@@ -526,37 +779,7 @@ def generate_box_geometry_no_bottom(
         - vertices is a list of [x, y, z] coordinates
         - triangles is a list of (v0, v1, v2) vertex indices
     """
-    vertices = [
-        [x0, y0, z0],  # 0: bottom-left-bottom
-        [x1, y0, z0],  # 1: bottom-right-bottom
-        [x1, y1, z0],  # 2: top-right-bottom
-        [x0, y1, z0],  # 3: top-left-bottom
-        [x0, y0, z1],  # 4: bottom-left-top
-        [x1, y0, z1],  # 5: bottom-right-top
-        [x1, y1, z1],  # 6: top-right-top
-        [x0, y1, z1],  # 7: top-left-top
-    ]
-
-    triangles = [
-        # NO BOTTOM FACE - this sits on the base plate
-        # Top face
-        (4, 5, 6),
-        (4, 6, 7),
-        # Front face
-        (0, 1, 5),
-        (0, 5, 4),
-        # Back face
-        (3, 7, 6),
-        (3, 6, 2),
-        # Left face
-        (0, 4, 7),
-        (0, 7, 3),
-        # Right face
-        (1, 2, 6),
-        (1, 6, 5),
-    ]
-
-    return vertices, triangles
+    return _box_vertices(x0, y0, z0, x1, y1, z1), list(_BOX_FACES[2:])
 
 
 def generate_box_geometry_no_top(
@@ -564,6 +787,8 @@ def generate_box_geometry_no_top(
 ) -> tuple[list[list[float]], list[tuple[int, int, int]]]:
     """Generate vertices and triangles for a 3D box without top face.
 
+    The top face is omitted because individual pixels provide the top surface.
+
     Args:
         x0, y0, z0: Minimum coordinates
         x1, y1, z1: Maximum coordinates
@@ -573,37 +798,7 @@ def generate_box_geometry_no_top(
         - vertices is a list of [x, y, z] coordinates
         - triangles is a list of (v0, v1, v2) vertex indices
     """
-    vertices = [
-        [x0, y0, z0],  # 0: bottom-left-bottom
-        [x1, y0, z0],  # 1: bottom-right-bottom
-        [x1, y1, z0],  # 2: top-right-bottom
-        [x0, y1, z0],  # 3: top-left-bottom
-        [x0, y0, z1],  # 4: bottom-left-top
-        [x1, y0, z1],  # 5: bottom-right-top
-        [x1, y1, z1],  # 6: top-right-top
-        [x0, y1, z1],  # 7: top-left-top
-    ]
-
-    triangles = [
-        # Bottom face
-        (0, 2, 1),
-        (0, 3, 2),
-        # NO TOP FACE - individual pixels provide the top surface
-        # Front face
-        (0, 1, 5),
-        (0, 5, 4),
-        # Back face
-        (3, 7, 6),
-        (3, 6, 2),
-        # Left face
-        (0, 4, 7),
-        (0, 7, 3),
-        # Right face
-        (1, 2, 6),
-        (1, 6, 5),
-    ]
-
-    return vertices, triangles
+    return _box_vertices(x0, y0, z0, x1, y1, z1), list(_BOX_FACES[:2]) + list(_BOX_FACES[4:])
 
 
 def generate_qr_geometry(
@@ -629,163 +824,166 @@ def generate_qr_geometry(
         - component_info contains lists of triangle indices for different components
     """
     height, width = height_map.shape
-    vertices = []
-    triangles = []
-    component_info = {"base_triangles": [], "qr_triangles": [], "wall_triangles": [], "top_surface_triangles": []}
+
+    # Geometry is built one vectorized block per section (top surface,
+    # internal walls, outer walls, base) - each block contributes a
+    # (quads, 4, 3) vertex array and the matching (quads, 2, 3) index array
+    vert_blocks: list[np.ndarray] = []
+    tri_blocks: list[np.ndarray] = []
+    vert_count = 0
+    tri_count = 0
+
+    def add_quads(quad_verts: np.ndarray, higher: np.ndarray | None = None) -> np.ndarray:
+        """Append a block of quads and return the global indices of its triangles.
+
+        Args:
+            quad_verts: (N, 4, 3) array with each quad's corners in fan order
+            higher: Optional boolean array selecting the flipped winding per quad
+
+        Returns:
+            (N, 2) array of global triangle indices for the block
+        """
+        nonlocal vert_count, tri_count
+        n = len(quad_verts)
+        starts = vert_count + 4 * np.arange(n)
+
+        # Default winding (s, s+1, s+3), (s+1, s+2, s+3); where `higher` is
+        # False the quad flips to (s, s+3, s+1), (s+3, s+2, s+1)
+        tris = np.empty((n, 2, 3), dtype=np.int64)
+        second = starts + 1 if higher is None else np.where(higher, starts + 1, starts + 3)
+        fourth = starts + 3 if higher is None else np.where(higher, starts + 3, starts + 1)
+        tris[:, 0, 0] = starts
+        tris[:, 0, 1] = second
+        tris[:, 0, 2] = fourth
+        tris[:, 1, 0] = second
+        tris[:, 1, 1] = starts + 2
+        tris[:, 1, 2] = fourth
+
+        vert_blocks.append(quad_verts.reshape(-1, 3))
+        tri_blocks.append(tris.reshape(-1, 3))
+        tri_indices = (tri_count + np.arange(2 * n)).reshape(n, 2)
+        vert_count += 4 * n
+        tri_count += 2 * n
+        return tri_indices
 
     # Generate top surface for ALL pixels (matching main branch approach)
-    for y in range(height):
-        for x in range(width):
-            # Get the four corners of this pixel
-            x0, y0 = x * pixel_size, y * pixel_size
-            x1, y1 = (x + 1) * pixel_size, (y + 1) * pixel_size
-
-            # Height for this pixel
-            h = height_map[y, x]
-
-            # Add vertices for this pixel's top surface
-            v_start = len(vertices)
-            vertices.extend([[x0, y0, h], [x1, y0, h], [x1, y1, h], [x0, y1, h]])
-
-            # Add triangles for top surface
-            tri_start = len(triangles)
-            # First triangle
-            triangles.append((v_start, v_start + 1, v_start + 3))
-            # Second triangle
-            triangles.append((v_start + 1, v_start + 2, v_start + 3))
-
-            # Track which component these triangles belong to
-            if abs(h - base_height) < 0.001:
-                # This is at base height
-                component_info["base_triangles"].extend(range(tri_start, len(triangles)))
-            else:
-                # This is a raised QR module
-                component_info["qr_triangles"].extend(range(tri_start, len(triangles)))
+    x0g = (np.arange(width, dtype=np.float64) * pixel_size)[None, :]
+    y0g = (np.arange(height, dtype=np.float64) * pixel_size)[:, None]
+    x1g = x0g + pixel_size
+    y1g = y0g + pixel_size
+
+    top_verts = np.empty((height, width, 4, 3), dtype=np.float64)
+    top_verts[..., 0, 0] = x0g
+    top_verts[..., 0, 1] = y0g
+    top_verts[..., 1, 0] = x1g
+    top_verts[..., 1, 1] = y0g
+    top_verts[..., 2, 0] = x1g
+    top_verts[..., 2, 1] = y1g
+    top_verts[..., 3, 0] = x0g
+    top_verts[..., 3, 1] = y1g
+    top_verts[..., 2] = height_map[:, :, None]
+    top_tri_indices = add_quads(top_verts.reshape(-1, 4, 3))
+
+    # Split top triangles into base-height and raised QR components
+    raised = (np.abs(height_map - base_height) >= 0.001).ravel()
+    component_info = {
+        "base_triangles": top_tri_indices[~raised].ravel().tolist(),
+        "qr_triangles": top_tri_indices[raised].ravel().tolist(),
+        "wall_triangles": [],
+        "top_surface_triangles": [],
+    }
+
+    def add_transition_walls(ys: np.ndarray, xs: np.ndarray, neighbor_axis: int) -> None:
+        """Emit vertical walls for the given height transitions.
+
+        Args:
+            ys: Row indices of the transition cells
+            xs: Column indices of the transition cells
+            neighbor_axis: 1 for right-neighbor walls, 0 for bottom-neighbor walls
+        """
+        if ys.size == 0:
+            return
+        curr_h = height_map[ys, xs]
+        other_h = height_map[ys, xs + 1] if neighbor_axis == 1 else height_map[ys + 1, xs]
+        min_h = np.minimum(curr_h, other_h)
+        max_h = np.maximum(curr_h, other_h)
+
+        walls = np.empty((ys.size, 4, 3), dtype=np.float64)
+        if neighbor_axis == 1:
+            # Wall on the right edge of the cell: x fixed at x1
+            walls[..., 0] = ((xs + 1) * np.float64(pixel_size))[:, None]
+            walls[:, 0, 1] = walls[:, 3, 1] = ys * np.float64(pixel_size)
+            walls[:, 1, 1] = walls[:, 2, 1] = (ys + 1) * np.float64(pixel_size)
+        else:
+            # Wall on the bottom edge of the cell: y fixed at y1
+            walls[..., 1] = ((ys + 1) * np.float64(pixel_size))[:, None]
+            walls[:, 0, 0] = walls[:, 3, 0] = xs * np.float64(pixel_size)
+            walls[:, 1, 0] = walls[:, 2, 0] = (xs + 1) * np.float64(pixel_size)
+        walls[:, 0, 2] = walls[:, 1, 2] = min_h
+        walls[:, 2, 2] = walls[:, 3, 2] = max_h
+
+        wall_tri_indices = add_quads(walls, higher=curr_h > other_h)
+        component_info["wall_triangles"].extend(wall_tri_indices.ravel().tolist())
 
     if include_walls:
         # Generate internal walls at height transitions
-        for y in range(height):
-            for x in range(width):
-                x0, y0 = x * pixel_size, y * pixel_size
-                x1, y1 = (x + 1) * pixel_size, (y + 1) * pixel_size
-                curr_height = height_map[y, x]
-
-                # Check right neighbor
-                if x < width - 1:
-                    right_height = height_map[y, x + 1]
-                    if curr_height != right_height:
-                        min_h = min(curr_height, right_height)
-                        max_h = max(curr_height, right_height)
-
-                        # Add wall vertices
-                        v_start = len(vertices)
-                        vertices.extend([[x1, y0, min_h], [x1, y1, min_h], [x1, y1, max_h], [x1, y0, max_h]])
-
-                        # Add wall triangles
-                        tri_start = len(triangles)
-                        if curr_height > right_height:
-                            # Normal points left
-                            triangles.extend(
-                                [(v_start, v_start + 1, v_start + 3), (v_start + 1, v_start + 2, v_start + 3)]
-                            )
-                        else:
-                            # Normal points right
-                            triangles.extend(
-                                [(v_start, v_start + 3, v_start + 1), (v_start + 3, v_start + 2, v_start + 1)]
-                            )
-                        component_info["wall_triangles"].extend(range(tri_start, len(triangles)))
-
-                # Check bottom neighbor
-                if y < height - 1:
-                    bottom_height = height_map[y + 1, x]
-                    if curr_height != bottom_height:
-                        min_h = min(curr_height, bottom_height)
-                        max_h = max(curr_height, bottom_height)
-
-                        # Add wall vertices
-                        v_start = len(vertices)
-                        vertices.extend([[x0, y1, min_h], [x1, y1, min_h], [x1, y1, max_h], [x0, y1, max_h]])
-
-                        # Add wall triangles
-                        tri_start = len(triangles)
-                        if curr_height > bottom_height:
-                            # Normal points up
-                            triangles.extend(
-                                [(v_start, v_start + 1, v_start + 3), (v_start + 1, v_start + 2, v_start + 3)]
-                            )
-                        else:
-                            # Normal points down
-                            triangles.extend(
-                                [(v_start, v_start + 3, v_start + 1), (v_start + 3, v_start + 2, v_start + 1)]
-                            )
-                        component_info["wall_triangles"].extend(range(tri_start, len(triangles)))
+        add_transition_walls(*np.nonzero(height_map[:, :-1] != height_map[:, 1:]), neighbor_axis=1)
+        add_transition_walls(*np.nonzero(height_map[:-1, :] != height_map[1:, :]), neighbor_axis=0)
 
     # Generate outer walls
     total_width = width * pixel_size
     total_depth = height * pixel_size
 
-    # Front wall (y=0)
-    for x in range(width):
-        x0, x1 = x * pixel_size, (x + 1) * pixel_size
-        h = height_map[0, x]
-
-        v_start = len(vertices)
-        vertices.extend([[x0, 0, 0], [x1, 0, 0], [x1, 0, h], [x0, 0, h]])
-
-        tri_start = len(triangles)
-        triangles.extend([(v_start, v_start + 1, v_start + 3), (v_start + 1, v_start + 2, v_start + 3)])
-        component_info["wall_triangles"].extend(range(tri_start, len(triangles)))
-
-    # Back wall (y=max)
-    for x in range(width):
-        x0, x1 = x * pixel_size, (x + 1) * pixel_size
-        h = height_map[height - 1, x]
-
-        v_start = len(vertices)
-        vertices.extend([[x0, total_depth, h], [x1, total_depth, h], [x1, total_depth, 0], [x0, total_depth, 0]])
-
-        tri_start = len(triangles)
-        triangles.extend([(v_start, v_start + 1, v_start + 3), (v_start + 1, v_start + 2, v_start + 3)])
-        component_info["wall_triangles"].extend(range(tri_start, len(triangles)))
-
-    # Left wall (x=0)
-    for y in range(height):
-        y0, y1 = y * pixel_size, (y + 1) * pixel_size
-        h = height_map[y, 0]
-
-        v_start = len(vertices)
-        vertices.extend([[0, y0, h], [0, y1, h], [0, y1, 0], [0, y0, 0]])
-
-        tri_start = len(triangles)
-        triangles.extend([(v_start, v_start + 1, v_start + 3), (v_start + 1, v_start + 2, v_start + 3)])
-        component_info["wall_triangles"].extend(range(tri_start, len(triangles)))
-
-    # Right wall (x=max)
-    for y in range(height):
-        y0, y1 = y * pixel_size, (y + 1) * pixel_size
-        h = height_map[y, width - 1]
-
-        v_start = len(vertices)
-        vertices.extend([[total_width, y0, 0], [total_width, y1, 0], [total_width, y1, h], [total_width, y0, h]])
-
-        tri_start = len(triangles)
-        triangles.extend([(v_start, v_start + 1, v_start + 3), (v_start + 1, v_start + 2, v_start + 3)])
-        component_info["wall_triangles"].extend(range(tri_start, len(triangles)))
+    xs0 = np.arange(width, dtype=np.float64) * pixel_size
+    xs1 = xs0 + pixel_size
+    ys0 = np.arange(height, dtype=np.float64) * pixel_size
+    ys1 = ys0 + pixel_size
+
+    # Front wall (y=0): quads (x0,0,0) (x1,0,0) (x1,0,h) (x0,0,h)
+    walls = np.zeros((width, 4, 3), dtype=np.float64)
+    walls[:, 0, 0] = walls[:, 3, 0] = xs0
+    walls[:, 1, 0] = walls[:, 2, 0] = xs1
+    walls[:, 2, 2] = walls[:, 3, 2] = height_map[0, :]
+    component_info["wall_triangles"].extend(add_quads(walls).ravel().tolist())
+
+    # Back wall (y=max): quads (x0,Y,h) (x1,Y,h) (x1,Y,0) (x0,Y,0)
+    walls = np.zeros((width, 4, 3), dtype=np.float64)
+    walls[..., 1] = total_depth
+    walls[:, 0, 0] = walls[:, 3, 0] = xs0
+    walls[:, 1, 0] = walls[:, 2, 0] = xs1
+    walls[:, 0, 2] = walls[:, 1, 2] = height_map[height - 1, :]
+    component_info["wall_triangles"].extend(add_quads(walls).ravel().tolist())
+
+    # Left wall (x=0): quads (0,y0,h) (0,y1,h) (0,y1,0) (0,y0,0)
+    walls = np.zeros((height, 4, 3), dtype=np.float64)
+    walls[:, 0, 1] = walls[:, 3, 1] = ys0
+    walls[:, 1, 1] = walls[:, 2, 1] = ys1
+    walls[:, 0, 2] = walls[:, 1, 2] = height_map[:, 0]
+    component_info["wall_triangles"].extend(add_quads(walls).ravel().tolist())
+
+    # Right wall (x=max): quads (X,y0,0) (X,y1,0) (X,y1,h) (X,y0,h)
+    walls = np.zeros((height, 4, 3), dtype=np.float64)
+    walls[..., 0] = total_width
+    walls[:, 0, 1] = walls[:, 3, 1] = ys0
+    walls[:, 1, 1] = walls[:, 2, 1] = ys1
+    walls[:, 2, 2] = walls[:, 3, 2] = height_map[:, width - 1]
+    component_info["wall_triangles"].extend(add_quads(walls).ravel().tolist())
 
     if include_base:
         # Generate bottom face - solid base covering entire area
-        v_start = len(vertices)
-        vertices.extend([[0, 0, 0], [total_width, 0, 0], [total_width, total_depth, 0], [0, total_depth, 0]])
+        base_quad = np.array(
+            [[[0, 0, 0], [total_width, 0, 0], [total_width, total_depth, 0], [0, total_depth, 0]]],
+            dtype=np.float64,
+        )
+        component_info["base_triangles"].extend(add_quads(base_quad).ravel().tolist())
 
-        # Add bottom face triangles
-        tri_start = len(triangles)
-        triangles.append((v_start, v_start + 1, v_start + 3))
-        triangles.append((v_start + 1, v_start + 2, v_start + 3))
-        component_info["base_triangles"].extend(range(tri_start, len(triangles)))
+    vertices = np.concatenate(vert_blocks).tolist()
+    triangles = list(map(tuple, np.concatenate(tri_blocks).tolist()))
 
     return vertices, triangles, component_info
 
 
+@lru_cache(maxsize=8)
 def generate_keychain_mount_geometry(
     base_width: float,
     base_depth: float,
@@ -794,9 +992,12 @@ def generate_keychain_mount_geometry(
     tab_width: float = 15.0,
     tab_height: float = 10.0,
     tab_thickness: float = 2.0,
-) -> tuple[list[list[float]], list[tuple[int, int, int]]]:
+) -> tuple[np.ndarray, np.ndarray]:
     """Generate vertex and triangle data for a keychain mounting tab.
 
+    Results are cached per parameter set, so repeated exports of the same
+    model (e.g. STL plus 3MF) reuse the geometry instead of rebuilding it.
+
     Args:
         base_width: Width of the QR code base in mm
         base_depth: Depth of the QR code base in mm
@@ -808,8 +1009,8 @@ def generate_keychain_mount_geometry(
 
     Returns:
         Tuple of (vertices, triangles) where:
-        - vertices is a list of [x, y, z] coordinates
-        - triangles is a list of (v0, v1, v2) vertex indices
+        - vertices is an Nx3 array of [x, y, z] coordinates
+        - triangles is an Nx3 array of (v0, v1, v2) vertex indices
     """
     # Position tab at the top center of the QR code
     tab_x_start = (base_width - tab_width) / 2
@@ -823,111 +1024,119 @@ def generate_keychain_mount_geometry(
     hole_center_y = tab_y_start + tab_height / 2
     hole_radius = hole_diameter / 2
 
-    vertices = []
-    triangles = []
-
-    # Add tab corner vertices (8 vertices for the tab box)
-    # Bottom face corners
-    vertices.append([tab_x_start, tab_y_start, 0])  # 0: bottom-left-bottom
-    vertices.append([tab_x_end, tab_y_start, 0])  # 1: bottom-right-bottom
-    vertices.append([tab_x_end, tab_y_end, 0])  # 2: top-right-bottom
-    vertices.append([tab_x_start, tab_y_end, 0])  # 3: top-left-bottom
-    # Top face corners
-    vertices.append([tab_x_start, tab_y_start, tab_thickness])  # 4: bottom-left-top
-    vertices.append([tab_x_end, tab_y_start, tab_thickness])  # 5: bottom-right-top
-    vertices.append([tab_x_end, tab_y_end, tab_thickness])  # 6: top-right-top
-    vertices.append([tab_x_start, tab_y_end, tab_thickness])  # 7: top-left-top
-
-    # Create octagon vertices for the hole
+    # Preallocate the vertex array: 8 tab corners plus two hole rings
     num_sides = 8
-    hole_vertices_top_start = len(vertices)
+    hole_vertices_top_start = 8
     hole_vertices_bottom_start = hole_vertices_top_start + num_sides
+    # float32 matches both the STL vector buffer and lib3mf positions,
+    # halving the bytes moved when the geometry is copied out
+    vertices = np.empty((8 + 2 * num_sides, 3), dtype=np.float32)
 
-    for i in range(num_sides):
-        angle = 2 * np.pi * i / num_sides
-        x = hole_center_x + hole_radius * np.cos(angle)
-        y = hole_center_y + hole_radius * np.sin(angle)
-        vertices.append([x, y, tab_thickness])  # Top hole vertices
-
-    for i in range(num_sides):
-        angle = 2 * np.pi * i / num_sides
-        x = hole_center_x + hole_radius * np.cos(angle)
-        y = hole_center_y + hole_radius * np.sin(angle)
-        vertices.append([x, y, 0])  # Bottom hole vertices
+    # Tab corner vertices (8 vertices for the tab box)
+    # Bottom face corners
+    vertices[0] = (tab_x_start, tab_y_start, 0)  # 0: bottom-left-bottom
+    vertices[1] = (tab_x_end, tab_y_start, 0)  # 1: bottom-right-bottom
+    vertices[2] = (tab_x_end, tab_y_end, 0)  # 2: top-right-bottom
+    vertices[3] = (tab_x_start, tab_y_end, 0)  # 3: top-left-bottom
+    # Top face corners
+    vertices[4] = (tab_x_start, tab_y_start, tab_thickness)  # 4: bottom-left-top
+    vertices[5] = (tab_x_end, tab_y_start, tab_thickness)  # 5: bottom-right-top
+    vertices[6] = (tab_x_end, tab_y_end, tab_thickness)  # 6: top-right-top
+    vertices[7] = (tab_x_start, tab_y_end, tab_thickness)  # 7: top-left-top
+
+    # Octagon vertices for the hole, computed in one vectorized pass
+    angles = 2 * np.pi * np.arange(num_sides) / num_sides
+    ring_x = hole_center_x + hole_radius * np.cos(angles)
+    ring_y = hole_center_y + hole_radius * np.sin(angles)
+
+    # Top hole vertices followed by bottom hole vertices
+    vertices[hole_vertices_top_start:hole_vertices_bottom_start, 0] = ring_x
+    vertices[hole_vertices_top_start:hole_vertices_bottom_start, 1] = ring_y
+    vertices[hole_vertices_top_start:hole_vertices_bottom_start, 2] = tab_thickness
+    vertices[hole_vertices_bottom_start:, 0] = ring_x
+    vertices[hole_vertices_bottom_start:, 1] = ring_y
+    vertices[hole_vertices_bottom_start:, 2] = 0
+
+    # Preallocate the triangle index array instead of growing a Python list:
+    # 12 top ring + 12 bottom ring + 8 side wall + 16 hole wall triangles
+    triangles = np.empty((48, 3), dtype=np.int32)
 
     # TOP FACE - Create triangles by connecting tab corners to hole vertices
     # We need to create a "ring" of triangles around the hole
     # Connect each edge of the tab to the corresponding hole vertices
-
-    # Bottom edge to hole (vertices 4-5 to hole vertices 5-6-7-0)
-    triangles.append((4, hole_vertices_top_start + 5, hole_vertices_top_start + 6))
-    triangles.append((4, hole_vertices_top_start + 6, hole_vertices_top_start + 7))
-    triangles.append((4, hole_vertices_top_start + 7, 5))
-    triangles.append((5, hole_vertices_top_start + 7, hole_vertices_top_start + 0))
-
-    # Right edge to hole (vertices 5-6 to hole vertices 0-1-2)
-    triangles.append((5, hole_vertices_top_start + 0, hole_vertices_top_start + 1))
-    triangles.append((5, hole_vertices_top_start + 1, 6))
-    triangles.append((6, hole_vertices_top_start + 1, hole_vertices_top_start + 2))
-
-    # Top edge to hole (vertices 6-7 to hole vertices 2-3-4)
-    triangles.append((6, hole_vertices_top_start + 2, hole_vertices_top_start + 3))
-    triangles.append((6, hole_vertices_top_start + 3, 7))
-    triangles.append((7, hole_vertices_top_start + 3, hole_vertices_top_start + 4))
-
-    # Left edge to hole (vertices 7-4 to hole vertices 4-5)
-    triangles.append((7, hole_vertices_top_start + 4, hole_vertices_top_start + 5))
-    triangles.append((7, hole_vertices_top_start + 5, 4))
+    triangles[0:12] = [
+        # Bottom edge to hole (vertices 4-5 to hole vertices 5-6-7-0)
+        (4, hole_vertices_top_start + 5, hole_vertices_top_start + 6),
+        (4, hole_vertices_top_start + 6, hole_vertices_top_start + 7),
+        (4, hole_vertices_top_start + 7, 5),
+        (5, hole_vertices_top_start + 7, hole_vertices_top_start + 0),
+        # Right edge to hole (vertices 5-6 to hole vertices 0-1-2)
+        (5, hole_vertices_top_start + 0, hole_vertices_top_start + 1),
+        (5, hole_vertices_top_start + 1, 6),
+        (6, hole_vertices_top_start + 1, hole_vertices_top_start + 2),
+        # Top edge to hole (vertices 6-7 to hole vertices 2-3-4)
+        (6, hole_vertices_top_start + 2, hole_vertices_top_start + 3),
+        (6, hole_vertices_top_start + 3, 7),
+        (7, hole_vertices_top_start + 3, hole_vertices_top_start + 4),
+        # Left edge to hole (vertices 7-4 to hole vertices 4-5)
+        (7, hole_vertices_top_start + 4, hole_vertices_top_start + 5),
+        (7, hole_vertices_top_start + 5, 4),
+    ]
 
     # BOTTOM FACE - Same pattern but reversed winding
-    # Bottom edge to hole (vertices 0-1 to hole vertices 5-6-7-0)
-    triangles.append((0, hole_vertices_bottom_start + 6, hole_vertices_bottom_start + 5))
-    triangles.append((0, hole_vertices_bottom_start + 7, hole_vertices_bottom_start + 6))
-    triangles.append((0, 1, hole_vertices_bottom_start + 7))
-    triangles.append((1, hole_vertices_bottom_start + 0, hole_vertices_bottom_start + 7))
-
-    # Right edge to hole (vertices 1-2 to hole vertices 0-1-2)
-    triangles.append((1, hole_vertices_bottom_start + 1, hole_vertices_bottom_start + 0))
-    triangles.append((1, 2, hole_vertices_bottom_start + 1))
-    triangles.append((2, hole_vertices_bottom_start + 2, hole_vertices_bottom_start + 1))
-
-    # Top edge to hole (vertices 2-3 to hole vertices 2-3-4)
-    triangles.append((2, hole_vertices_bottom_start + 3, hole_vertices_bottom_start + 2))
-    triangles.append((2, 3, hole_vertices_bottom_start + 3))
-    triangles.append((3, hole_vertices_bottom_start + 4, hole_vertices_bottom_start + 3))
-
-    # Left edge to hole (vertices 3-0 to hole vertices 4-5)
-    triangles.append((3, hole_vertices_bottom_start + 5, hole_vertices_bottom_start + 4))
-    triangles.append((3, 0, hole_vertices_bottom_start + 5))
+    triangles[12:24] = [
+        # Bottom edge to hole (vertices 0-1 to hole vertices 5-6-7-0)
+        (0, hole_vertices_bottom_start + 6, hole_vertices_bottom_start + 5),
+        (0, hole_vertices_bottom_start + 7, hole_vertices_bottom_start + 6),
+        (0, 1, hole_vertices_bottom_start + 7),
+        (1, hole_vertices_bottom_start + 0, hole_vertices_bottom_start + 7),
+        # Right edge to hole (vertices 1-2 to hole vertices 0-1-2)
+        (1, hole_vertices_bottom_start + 1, hole_vertices_bottom_start + 0),
+        (1, 2, hole_vertices_bottom_start + 1),
+        (2, hole_vertices_bottom_start + 2, hole_vertices_bottom_start + 1),
+        # Top edge to hole (vertices 2-3 to hole vertices 2-3-4)
+        (2, hole_vertices_bottom_start + 3, hole_vertices_bottom_start + 2),
+        (2, 3, hole_vertices_bottom_start + 3),
+        (3, hole_vertices_bottom_start + 4, hole_vertices_bottom_start + 3),
+        # Left edge to hole (vertices 3-0 to hole vertices 4-5)
+        (3, hole_vertices_bottom_start + 5, hole_vertices_bottom_start + 4),
+        (3, 0, hole_vertices_bottom_start + 5),
+    ]
 
     # SIDE WALLS
-    # Back face (connecting to QR code base)
-    triangles.append((0, 1, 4))
-    triangles.append((1, 5, 4))
-
-    # Front face (away from QR code)
-    triangles.append((3, 7, 2))
-    triangles.append((2, 7, 6))
-
-    # Left side
-    triangles.append((0, 4, 3))
-    triangles.append((3, 4, 7))
-
-    # Right side
-    triangles.append((1, 2, 5))
-    triangles.append((2, 6, 5))
+    triangles[24:32] = [
+        # Back face (connecting to QR code base)
+        (0, 1, 4),
+        (1, 5, 4),
+        # Front face (away from QR code)
+        (3, 7, 2),
+        (2, 7, 6),
+        # Left side
+        (0, 4, 3),
+        (3, 4, 7),
+        # Right side
+        (1, 2, 5),
+        (2, 6, 5),
+    ]
 
     # HOLE WALLS - normals should point outward (away from hole center)
-    for i in range(num_sides):
-        next_i = (i + 1) % num_sides
-        top_i = hole_vertices_top_start + i
-        top_next = hole_vertices_top_start + next_i
-        bottom_i = hole_vertices_bottom_start + i
-        bottom_next = hole_vertices_bottom_start + next_i
-
-        # Two triangles per wall segment with correct winding for outward normals
-        triangles.append((top_i, top_next, bottom_i))
-        triangles.append((top_next, bottom_next, bottom_i))
+    # Build both triangles of every wall segment in one vectorized pass,
+    # with correct winding for outward normals
+    ring = np.arange(num_sides)
+    ring_next = (ring + 1) % num_sides
+    top_i = hole_vertices_top_start + ring
+    top_next = hole_vertices_top_start + ring_next
+    bottom_i = hole_vertices_bottom_start + ring
+    bottom_next = hole_vertices_bottom_start + ring_next
+
+    triangles[32::2] = np.column_stack((top_i, top_next, bottom_i))
+    triangles[33::2] = np.column_stack((top_next, bottom_next, bottom_i))
+
+    # The same arrays are handed to every caller for a given parameter set,
+    # so freeze them - a caller writing into one would otherwise corrupt the
+    # cached geometry for every later export
+    vertices.setflags(write=False)
+    triangles.setflags(write=False)
 
     return vertices, triangles
 
@@ -962,16 +1171,15 @@ def add_keychain_mount(
         base_width, base_depth, base_height, hole_diameter, tab_width, tab_height, tab_thickness=2.0
     )
 
-    # Add triangles to STL mesh
-    for v0, v1, v2 in triangles:
-        stl_mesh.vectors[face_idx] = np.array([vertices[v0], vertices[v1], vertices[v2]])
-        face_idx += 1
+    # Bulk-write all mount faces at once via fancy indexing
+    triangle_indices = np.asarray(triangles, dtype=np.intp)
+    stl_mesh.vectors[face_idx : face_idx + len(triangle_indices)] = vertices[triangle_indices]
 
-    return face_idx
+    return face_idx + len(triangle_indices)
 
 
 def add_keychain_mount_3mf(
-    mesh_object: Any,
+    geometry: tuple[list[Any], list[Any]],
     base_width: float,
     base_depth: float,
     base_height: float,
@@ -983,10 +1191,10 @@ def add_keychain_mount_3mf(
     tab_width: float = 15.0,
     tab_height: float = 10.0,
 ) -> None:
-    """Add a keychain mounting tab with hole to a 3MF mesh object.
+    """Add a keychain mounting tab with hole to a 3MF geometry accumulator.
 
     Args:
-        mesh_object: The 3MF mesh object to add mount to
+        geometry: Tuple of (positions, triangles) lists to append the mount to
         base_width: Width of the QR code base in mm
         base_depth: Depth of the QR code base in mm
         base_height: Height of the base in mm
@@ -998,35 +1206,40 @@ def add_keychain_mount_3mf(
         tab_width: Width of the mounting tab in mm
         tab_height: Height of the mounting tab in mm
     """
+    positions, mesh_triangles = geometry
+
     # Generate the shared geometry with a thinner tab (2mm thickness)
     vertices, triangles = generate_keychain_mount_geometry(
         base_width, base_depth, base_height, hole_diameter, tab_width, tab_height, tab_thickness=2.0
     )
 
-    # Add vertices to 3MF mesh and store their indices
-    vertex_indices = []
-    for x, y, z in vertices:
+    # Append vertices to the accumulator, offsetting indices past any
+    # geometry that is already present. tolist() converts the whole array to
+    # Python floats in one pass instead of casting scalar by scalar
+    vertex_start = len(positions)
+    for x, y, z in vertices.tolist():
         position = lib3mf.Position()
-        position.Coordinates[0] = float(x)
-        position.Coordinates[1] = float(y)
-        position.Coordinates[2] = float(z)
-        vertex_indices.append(mesh_object.AddVertex(position))
+        position.Coordinates[0] = x
+        position.Coordinates[1] = y
+        position.Coordinates[2] = z
+        positions.append(position)
 
-    # Add triangles to 3MF mesh
-    for v0, v1, v2 in triangles:
+    # Append triangles to the accumulator
+    for v0, v1, v2 in triangles.tolist():
         triangle = lib3mf.Triangle()
-        triangle.Indices[0] = vertex_indices[v0]
-        triangle.Indices[1] = vertex_indices[v1]
-        triangle.Indices[2] = vertex_indices[v2]
-        mesh_object.AddTriangle(triangle)
+        triangle.Indices[0] = vertex_start + v0
+        triangle.Indices[1] = vertex_start + v1
+        triangle.Indices[2] = vertex_start + v2
+        mesh_triangles.append(triangle)
 
-        if material_group is not None and triangle_properties is not None:
-            prop = lib3mf.TriangleProperties()
-            prop.ResourceID = material_group.GetResourceID()
-            prop.PropertyIDs[0] = material_id
-            prop.PropertyIDs[1] = material_id
-            prop.PropertyIDs[2] = material_id
-            triangle_properties.append(prop)
+    if material_group is not None and triangle_properties is not None:
+        # One shared property template covers every mount triangle
+        prop = lib3mf.TriangleProperties()
+        prop.ResourceID = material_group.GetResourceID()
+        prop.PropertyIDs[0] = material_id
+        prop.PropertyIDs[1] = material_id
+        prop.PropertyIDs[2] = material_id
+        triangle_properties.extend([prop] * len(triangles))
 
 
 def convert_qr_to_stl(
@@ -1095,17 +1308,9 @@ def convert_qr_to_stl(
             invert=invert,
         )
 
-    # Flip the height map vertically to correct the orientation
-    # This ensures labels at the top of the image appear at the top of the STL
-    height_map = np.flipud(height_map)
-
-    # Calculate pixel size to achieve desired base size
+    # Calculate uniform pixel size to achieve desired base size
     img_height, img_width = height_map.shape
-    pixel_size_x = base_size_mm[0] / img_width
-    pixel_size_y = base_size_mm[1] / img_height
-
-    # Use uniform pixel size (average of x and y)
-    pixel_size = (pixel_size_x + pixel_size_y) / 2
+    pixel_size = _compute_pixel_size(height_map.shape, base_size_mm)
 
     logger.debug(f"Image size: {img_width}x{img_height}, pixel size: {pixel_size:.3f}mm")
 
@@ -1114,7 +1319,8 @@ def convert_qr_to_stl(
     if debug:
         debug_path = output_path.with_suffix(".debug.png")
 
-    # Create STL mesh
+    # Create STL mesh, flipping the height map vertically to correct the
+    # orientation so labels at the top of the image appear at the top of the STL
     stl_mesh = create_stl_from_heightmap(
         height_map,
         pixel_size=pixel_size,
@@ -1122,10 +1328,13 @@ def convert_qr_to_stl(
         hole_diameter=hole_diameter,
         validate_and_repair=True,
         debug_path=debug_path,
+        flip_vertical=True,
     )
 
-    # Save STL file
-    stl_mesh.save(str(output_path))
+    # Save STL file - normals are already set on the mesh, so write the
+    # binary payload directly without the extension sniff or a redundant
+    # normal recomputation pass
+    stl_mesh.save(str(output_path), mode=Mode.BINARY, update_normals=False)
 
     if multi_layer and layer_heights:
         total_height = max(layer_heights)
@@ -1210,18 +1419,17 @@ def convert_qr_to_3mf(
     )
 
     # Flip the height map vertically to correct the orientation
-    height_map = np.flipud(height_map)
+    # The negative-stride view avoids copying the array
+    height_map = height_map[::-1]
 
-    # Calculate pixel size to achieve desired base size
+    # Calculate uniform pixel size to achieve desired base size
     img_height, img_width = height_map.shape
-    pixel_size_x = base_size_mm[0] / img_width
-    pixel_size_y = base_size_mm[1] / img_height
-    pixel_size = (pixel_size_x + pixel_size_y) / 2
+    pixel_size = _compute_pixel_size(height_map.shape, base_size_mm)
 
     logger.debug(f"Image size: {img_width}x{img_height}, pixel size: {pixel_size:.3f}mm")
 
-    # Initialize lib3mf
-    wrapper = get_wrapper()
+    # Initialize lib3mf (the wrapper itself is cached across exports)
+    wrapper = _get_lib3mf_wrapper()
     model = wrapper.CreateModel()  # type: ignore[attr-defined]
 
     if separate_components:
@@ -1261,23 +1469,112 @@ def convert_qr_to_3mf(
         mesh_object.SetName("QR Code")
         triangle_properties = []
 
+        # Build one shared property template per material up front - every
+        # triangle of a component references the same instance, so nothing
+        # needs to be constructed in the emission loops
+        material_resource_id = material_group.GetResourceID()
+        qr_prop = lib3mf.TriangleProperties()
+        qr_prop.ResourceID = material_resource_id
+        qr_prop.PropertyIDs[0] = qr_material_id
+        qr_prop.PropertyIDs[1] = qr_material_id
+        qr_prop.PropertyIDs[2] = qr_material_id
+
+        base_prop = lib3mf.TriangleProperties()
+        base_prop.ResourceID = material_resource_id
+        base_prop.PropertyIDs[0] = base_material_id
+        base_prop.PropertyIDs[1] = base_material_id
+        base_prop.PropertyIDs[2] = base_material_id
+
+    # Hoist the struct constructors out of the hot loops
+    make_position = lib3mf.Position
+    make_triangle = lib3mf.Triangle
+
+    # Accumulate geometry in Python lists and hand each mesh its vertices and
+    # triangles with a single SetGeometry call instead of one AddVertex /
+    # AddTriangle round-trip through the lib3mf binding per element
+    # Each accumulator gets a coordinate -> index map so boxes that share
+    # corners with their neighbors reuse vertices instead of re-adding them
+    if separate_components:
+        base_geometry: tuple[list[Any], list[Any]] = ([], [])
+        qr_geometry: tuple[list[Any], list[Any]] = ([], [])
+        base_vertex_map: dict[tuple[float, float, float], int] = {}
+        qr_vertex_map: dict[tuple[float, float, float], int] = {}
+    else:
+        mesh_geometry: tuple[list[Any], list[Any]] = ([], [])
+        mesh_vertex_map: dict[tuple[float, float, float], int] = {}
+
+    def get_vertex(
+        positions: list[Any],
+        vertex_map: dict[tuple[float, float, float], int],
+        vx: float,
+        vy: float,
+        vz: float,
+    ) -> int:
+        """Return the index of a vertex, appending it to the accumulator if new."""
+        key = (vx, vy, vz)
+        index = vertex_map.get(key)
+        if index is None:
+            position = make_position()
+            position.Coordinates[0] = vx
+            position.Coordinates[1] = vy
+            position.Coordinates[2] = vz
+            index = len(positions)
+            positions.append(position)
+            vertex_map[key] = index
+        return index
+
     # Build QR modules
+    # Find the raised pixels with one vectorized pass over the height map,
+    # then greedy-merge horizontal runs of equal-height raised pixels so each
+    # run becomes a single box instead of one box per pixel
+    raised_mask = np.abs(height_map - base_height_mm) >= 0.001
+    module_rects: list[list[int]] = []
+    prev_row_rects: dict[tuple[int, int, float], list[int]] = {}
     for y in range(img_height):
-        for x in range(img_width):
-            x0, y0 = x * pixel_size, y * pixel_size
-            x1, y1 = (x + 1) * pixel_size, (y + 1) * pixel_size
-            z0 = base_height_mm  # Start from base height
-            z1 = height_map[y, x]
-
-            # Skip if this pixel is at base height (no need to create a box)
-            if abs(z1 - base_height_mm) < 0.001:
-                continue
-
-            # Choose which mesh to add to
-            current_mesh = qr_mesh if separate_components else mesh_object
+        row_mask = raised_mask[y]
+        if not row_mask.any():
+            prev_row_rects = {}
+            continue
+        row_heights = height_map[y]
+
+        # Run boundaries fall where the raised state or the height changes
+        changes = np.flatnonzero((row_mask[1:] != row_mask[:-1]) | (row_heights[1:] != row_heights[:-1])) + 1
+        edges = np.concatenate(([0], changes, [img_width]))
+
+        # Merge vertically: a run whose column extent and height match a run
+        # in the previous row extends that rectangle downward instead of
+        # starting a new box, so each QR module becomes a single box
+        row_rects: dict[tuple[int, int, float], list[int]] = {}
+        for run_start, run_end in zip(edges[:-1], edges[1:]):
+            if row_mask[run_start]:
+                key = (int(run_start), int(run_end), float(row_heights[run_start]))
+                rect = prev_row_rects.get(key)
+                if rect is not None:
+                    rect[1] = y + 1
+                else:
+                    rect = [y, y + 1, int(run_start), int(run_end)]
+                    module_rects.append(rect)
+                row_rects[key] = rect
+        prev_row_rects = row_rects
+
+    for rect_y0, rect_y1, run_start, run_end in module_rects:
+        x0, y0 = float(run_start * pixel_size), float(rect_y0 * pixel_size)
+        x1, y1 = float(run_end * pixel_size), float(rect_y1 * pixel_size)
+        z0 = float(base_height_mm)  # Start from base height
+        z1 = float(height_map[rect_y0, run_start])
+
+        # Choose which geometry accumulator to add to
+        if separate_components:
+            current_positions, current_triangles = qr_geometry
+            current_map = qr_vertex_map
+        else:
+            current_positions, current_triangles = mesh_geometry
+            current_map = mesh_vertex_map
 
-            # Add 8 vertices for the box
-            vertices_indices = []
+        # Look up or add the 8 box corners - runs stacked in adjacent rows
+        # share their boundary corners, so most boxes only add 4 new vertices
+        corner_indices = [
+            get_vertex(current_positions, current_map, vx, vy, vz)
             for vx, vy, vz in [
                 (x0, y0, z0),
                 (x1, y0, z0),
@@ -1287,114 +1584,59 @@ def convert_qr_to_3mf(
                 (x1, y0, z1),
                 (x1, y1, z1),
                 (x0, y1, z1),
-            ]:
-                position = lib3mf.Position()
-                position.Coordinates[0] = float(vx)
-                position.Coordinates[1] = float(vy)
-                position.Coordinates[2] = float(vz)
-                vertices_indices.append(current_mesh.AddVertex(position))
-
-            # Create triangles for the box (12 triangles, 2 per face)
-            triangle_indices = [
-                # Bottom face
-                (0, 2, 1),
-                (0, 3, 2),
-                # Top face
-                (4, 5, 6),
-                (4, 6, 7),
-                # Front face
-                (0, 1, 5),
-                (0, 5, 4),
-                # Back face
-                (3, 7, 6),
-                (3, 6, 2),
-                # Left face
-                (0, 4, 7),
-                (0, 7, 3),
-                # Right face
-                (1, 2, 6),
-                (1, 6, 5),
             ]
+        ]
 
-            # Add triangles and set material
-            for v0, v1, v2 in triangle_indices:
-                triangle = lib3mf.Triangle()
-                triangle.Indices[0] = vertices_indices[v0]
-                triangle.Indices[1] = vertices_indices[v1]
-                triangle.Indices[2] = vertices_indices[v2]
-                current_mesh.AddTriangle(triangle)
-
-                if not separate_components:
-                    # Create triangle properties with QR material
-                    prop = lib3mf.TriangleProperties()
-                    prop.ResourceID = material_group.GetResourceID()
-                    prop.PropertyIDs[0] = qr_material_id
-                    prop.PropertyIDs[1] = qr_material_id
-                    prop.PropertyIDs[2] = qr_material_id
-                    triangle_properties.append(prop)
+        # Add the box triangles (12 triangles, 2 per face) and set material
+        for v0, v1, v2 in _BOX_TRIANGLES:
+            triangle = make_triangle()
+            triangle.Indices[0] = corner_indices[v0]
+            triangle.Indices[1] = corner_indices[v1]
+            triangle.Indices[2] = corner_indices[v2]
+            current_triangles.append(triangle)
+
+        if not separate_components:
+            # Reference the shared QR material template for every triangle
+            triangle_properties.extend([qr_prop] * len(_BOX_TRIANGLES))
 
     # Add complete base plate as a box
     base_width = img_width * pixel_size
     base_depth = img_height * pixel_size
 
-    # Choose which mesh to add base to
-    base_target_mesh = base_mesh if separate_components else mesh_object
-
-    # Create 8 vertices for the base box
-    base_vertices = []
-    for vx, vy, vz in [
-        (0, 0, 0),  # 0: bottom-left-bottom
-        (base_width, 0, 0),  # 1: bottom-right-bottom
-        (base_width, base_depth, 0),  # 2: top-right-bottom
-        (0, base_depth, 0),  # 3: top-left-bottom
-        (0, 0, base_height_mm),  # 4: bottom-left-top
-        (base_width, 0, base_height_mm),  # 5: bottom-right-top
-        (base_width, base_depth, base_height_mm),  # 6: top-right-top
-        (0, base_depth, base_height_mm),  # 7: top-left-top
-    ]:
-        position = lib3mf.Position()
-        position.Coordinates[0] = float(vx)
-        position.Coordinates[1] = float(vy)
-        position.Coordinates[2] = float(vz)
-        base_vertices.append(base_target_mesh.AddVertex(position))
-
-    # Create triangles for all 6 faces of the base box
-    base_triangle_indices = [
-        # Bottom face
-        (0, 2, 1),
-        (0, 3, 2),
-        # Top face
-        (4, 5, 6),
-        (4, 6, 7),
-        # Front face
-        (0, 1, 5),
-        (0, 5, 4),
-        # Back face
-        (3, 7, 6),
-        (3, 6, 2),
-        # Left face
-        (0, 4, 7),
-        (0, 7, 3),
-        # Right face
-        (1, 2, 6),
-        (1, 6, 5),
+    # Choose which geometry accumulator to add base to
+    if separate_components:
+        base_positions, base_triangles = base_geometry
+        base_map = base_vertex_map
+    else:
+        base_positions, base_triangles = mesh_geometry
+        base_map = mesh_vertex_map
+
+    # Look up or add the 8 corners of the base box
+    base_corner_indices = [
+        get_vertex(base_positions, base_map, float(vx), float(vy), float(vz))
+        for vx, vy, vz in [
+            (0, 0, 0),  # 0: bottom-left-bottom
+            (base_width, 0, 0),  # 1: bottom-right-bottom
+            (base_width, base_depth, 0),  # 2: top-right-bottom
+            (0, base_depth, 0),  # 3: top-left-bottom
+            (0, 0, base_height_mm),  # 4: bottom-left-top
+            (base_width, 0, base_height_mm),  # 5: bottom-right-top
+            (base_width, base_depth, base_height_mm),  # 6: top-right-top
+            (0, base_depth, base_height_mm),  # 7: top-left-top
+        ]
     ]
 
-    for v0, v1, v2 in base_triangle_indices:
-        triangle = lib3mf.Triangle()
-        triangle.Indices[0] = base_vertices[v0]
-        triangle.Indices[1] = base_vertices[v1]
-        triangle.Indices[2] = base_vertices[v2]
-        base_target_mesh.AddTriangle(triangle)
+    # Create triangles for all 6 faces of the base box
+    for v0, v1, v2 in _BOX_TRIANGLES:
+        triangle = make_triangle()
+        triangle.Indices[0] = base_corner_indices[v0]
+        triangle.Indices[1] = base_corner_indices[v1]
+        triangle.Indices[2] = base_corner_indices[v2]
+        base_triangles.append(triangle)
 
-        if not separate_components:
-            # Create triangle properties with base material
-            prop = lib3mf.TriangleProperties()
-            prop.ResourceID = material_group.GetResourceID()
-            prop.PropertyIDs[0] = base_material_id
-            prop.PropertyIDs[1] = base_material_id
-            prop.PropertyIDs[2] = base_material_id
-            triangle_properties.append(prop)
+    if not separate_components:
+        # Reference the shared base material template for every triangle
+        triangle_properties.extend([base_prop] * len(_BOX_TRIANGLES))
 
     # Add mounting features if requested
     if mount_type == "keychain":
@@ -1403,12 +1645,12 @@ def convert_qr_to_3mf(
         base_width = img_width * pixel_size
         base_depth = img_height * pixel_size
 
-        # Choose which mesh to add mount to
-        mount_target_mesh = base_mesh if separate_components else mesh_object
+        # Choose which geometry accumulator to add mount to
+        mount_geometry = base_geometry if separate_components else mesh_geometry
 
         # Add keychain mount using similar logic as STL version
         add_keychain_mount_3mf(
-            mount_target_mesh,
+            mount_geometry,
             base_width,
             base_depth,
             base_height_mm,  # Use base height, not max height
@@ -1419,12 +1661,17 @@ def convert_qr_to_3mf(
             wrapper,
         )
 
-    # Apply properties and add build items
+    # Upload the accumulated geometry, apply properties and add build items
     if separate_components:
+        base_mesh.SetGeometry(*base_geometry)
+        qr_mesh.SetGeometry(*qr_geometry)
+
         # Add both meshes as build items
         model.AddBuildItem(base_mesh, wrapper.GetIdentityTransform())  # type: ignore[attr-defined]
         model.AddBuildItem(qr_mesh, wrapper.GetIdentityTransform())  # type: ignore[attr-defined]
     else:
+        mesh_object.SetGeometry(*mesh_geometry)
+
         # Apply all triangle properties to single mesh
         mesh_object.SetAllTriangleProperties(triangle_properties)
         # Add single build item
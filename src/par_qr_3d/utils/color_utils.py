@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from functools import lru_cache
 from typing import TYPE_CHECKING
 
 from PIL import ImageColor
@@ -14,9 +15,13 @@ if TYPE_CHECKING:
 logger = get_logger(__name__)
 
 
+@lru_cache(maxsize=256)
 def parse_color(color_str: str, default_color: str = "black") -> tuple[int, int, int]:
     """Parse a color string into RGB tuple.
 
+    Results are cached, so batch exports reusing the same color strings
+    parse each one only once (and log an invalid color only once).
+
     Args:
         color_str: Color name or hex code
         default_color: Fallback color if parsing fails
@@ -43,6 +48,7 @@ def parse_color(color_str: str, default_color: str = "black") -> tuple[int, int,
             return (0, 0, 0)
 
 
+@lru_cache(maxsize=256)
 def normalize_rgb(rgb: tuple[int, int, int]) -> tuple[float, float, float]:
     """Normalize RGB values from 0-255 to 0.0-1.0 range.
 
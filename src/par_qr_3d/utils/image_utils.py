@@ -20,8 +20,21 @@ def ensure_grayscale(image: Image.Image) -> Image.Image:
     """
     if image.mode == "L":
         return image
-    logger.debug(f"Converting image from {image.mode} to grayscale")
-    return image.convert("L")
+    # Reuse a conversion already done for this image (e.g. STL and 3MF
+    # export of the same QR in one run) instead of copying the pixels again
+    cached = getattr(image, "_par_qr_3d_gray", None)
+    if cached is not None:
+        return cached
+    if image.mode == "LA":
+        # The luma channel already exists; extracting it skips the
+        # luminance recomputation a full convert("L") would do
+        logger.debug("Extracting L channel from LA image")
+        converted = image.getchannel("L")
+    else:
+        logger.debug(f"Converting image from {image.mode} to grayscale")
+        converted = image.convert("L")
+    image._par_qr_3d_gray = converted  # type: ignore[attr-defined]
+    return converted
 
 
 def ensure_rgb(image: Image.Image) -> Image.Image:
@@ -35,8 +48,13 @@ def ensure_rgb(image: Image.Image) -> Image.Image:
     """
     if image.mode == "RGB":
         return image
+    cached = getattr(image, "_par_qr_3d_rgb", None)
+    if cached is not None:
+        return cached
     logger.debug(f"Converting image from {image.mode} to RGB")
-    return image.convert("RGB")
+    converted = image.convert("RGB")
+    image._par_qr_3d_rgb = converted  # type: ignore[attr-defined]
+    return converted
 
 
 def ensure_mode(image: Image.Image, mode: str) -> Image.Image:
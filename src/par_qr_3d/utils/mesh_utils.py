@@ -3,10 +3,12 @@
 from __future__ import annotations
 
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 import numpy as np
-import trimesh
+
+if TYPE_CHECKING:
+    import trimesh
 
 
 def validate_mesh(mesh: trimesh.Trimesh, verbose: bool = False) -> dict[str, Any]:
@@ -33,13 +35,27 @@ def validate_mesh(mesh: trimesh.Trimesh, verbose: bool = False) -> dict[str, Any
         "non_manifold_edges": 0,
     }
 
+    # The checks below all read the same face array; bind it once so
+    # trimesh's property machinery is consulted a single time, and downcast
+    # to int32 so the sort/histogram kernels move half the bytes (trimesh
+    # stores int64; int32 holds any vertex index this tool can produce)
+    faces = mesh.faces
+    if faces.dtype != np.int32 and len(mesh.vertices) < 2**31:
+        faces = faces.astype(np.int32)
+
     # Check for edge manifold property
     try:
-        # Get edges and their face adjacency
-        edges_face = mesh.edges_face
-
-        # Count how many faces each edge belongs to
-        edge_face_count = np.bincount(edges_face.flatten())
+        # Build each face's three edges with sorted endpoints and count how
+        # many faces share each edge via a composite integer key; this works
+        # straight from the faces instead of materializing trimesh's
+        # edge-face adjacency (whose per-face bincount always came out as 3
+        # and wrongly flagged every face as a non-manifold edge)
+        edges = np.concatenate([faces[:, [0, 1]], faces[:, [1, 2]], faces[:, [2, 0]]])
+        edges.sort(axis=1)
+        edge_keys = edges[:, 0].astype(np.int64) * len(mesh.vertices) + edges[:, 1]
+        # np.unique keeps memory proportional to the edge count; a bincount
+        # over the composite keys would allocate an O(V^2) histogram
+        edge_face_count = np.unique(edge_keys, return_counts=True)[1]
 
         # Non-manifold edges have != 2 adjacent faces
         # (1 face = boundary edge, >2 faces = non-manifold)
@@ -53,21 +69,23 @@ def validate_mesh(mesh: trimesh.Trimesh, verbose: bool = False) -> dict[str, Any
         results["non_manifold_edges"] = -1
         results["is_edge_manifold"] = False
 
-    # Check for duplicate faces
-    unique_faces = {tuple(sorted(face)) for face in mesh.faces}
-    results["duplicate_faces"] = len(mesh.faces) - len(unique_faces)
+    # Check for duplicate faces - sort each face's indices, then view each
+    # row as one opaque record so np.unique takes its fast 1D path instead
+    # of the slower axis=0 row comparison
+    sorted_faces = np.ascontiguousarray(np.sort(faces, axis=1))
+    face_records = sorted_faces.view(np.dtype((np.void, sorted_faces.dtype.itemsize * 3))).ravel()
+    unique_face_count = len(np.unique(face_records))
+    results["duplicate_faces"] = len(faces) - unique_face_count
 
-    # Check for degenerate faces (faces with duplicate vertices)
-    degenerate_count = 0
-    for face in mesh.faces:
-        if len(set(face)) < 3:
-            degenerate_count += 1
-    results["degenerate_faces"] = degenerate_count
+    # Check for degenerate faces (faces with duplicate vertices) with three
+    # column compares instead of a Python set per face
+    degenerate_mask = (faces[:, 0] == faces[:, 1]) | (faces[:, 1] == faces[:, 2]) | (faces[:, 0] == faces[:, 2])
+    results["degenerate_faces"] = int(degenerate_mask.sum())
 
-    # Check for unreferenced vertices
-    referenced_vertices = set(mesh.faces.flatten())
-    all_vertices = set(range(len(mesh.vertices)))
-    results["unreferenced_vertices"] = len(all_vertices - referenced_vertices)
+    # Check for unreferenced vertices with a histogram over the face indices
+    # instead of materializing two Python sets of boxed ints
+    reference_counts = np.bincount(faces.ravel(), minlength=len(mesh.vertices))
+    results["unreferenced_vertices"] = int((reference_counts == 0).sum())
 
     if verbose:
         print("=== Mesh Validation Results ===")
@@ -105,32 +123,53 @@ def repair_mesh(mesh: trimesh.Trimesh, verbose: bool = False) -> trimesh.Trimesh
     if verbose and len(mesh.vertices) < original_vertex_count:
         print(f"Merged {original_vertex_count - len(mesh.vertices)} duplicate vertices")
 
+    # trimesh's removers rewrite the face array and invalidate the property
+    # cache even when there is nothing to remove, so probe for each issue
+    # with the same cheap vectorized checks validate_mesh uses and only run
+    # the removers that have work to do. The faces snapshot is taken after
+    # merge_vertices, which re-indexes them
+    faces = mesh.faces
+    if faces.dtype != np.int32 and len(mesh.vertices) < 2**31:
+        faces = faces.astype(np.int32)
+    faces_changed = False
+
     # Remove duplicate faces
-    original_face_count = len(mesh.faces)
-    mesh.remove_duplicate_faces()
-    if verbose and len(mesh.faces) < original_face_count:
-        print(f"Removed {original_face_count - len(mesh.faces)} duplicate faces")
+    sorted_faces = np.ascontiguousarray(np.sort(faces, axis=1))
+    face_records = sorted_faces.view(np.dtype((np.void, sorted_faces.dtype.itemsize * 3))).ravel()
+    if len(np.unique(face_records)) < len(faces):
+        original_face_count = len(mesh.faces)
+        mesh.remove_duplicate_faces()
+        faces_changed = True
+        if verbose and len(mesh.faces) < original_face_count:
+            print(f"Removed {original_face_count - len(mesh.faces)} duplicate faces")
 
     # Remove degenerate faces
-    original_face_count = len(mesh.faces)
-    mesh.remove_degenerate_faces()
-    if verbose and len(mesh.faces) < original_face_count:
-        print(f"Removed {original_face_count - len(mesh.faces)} degenerate faces")
-
-    # Remove unreferenced vertices
-    original_vertex_count = len(mesh.vertices)
-    mesh.remove_unreferenced_vertices()
-    if verbose and len(mesh.vertices) < original_vertex_count:
-        print(f"Removed {original_vertex_count - len(mesh.vertices)} unreferenced vertices")
-
-    # Fix normals if needed
+    if bool(((faces[:, 0] == faces[:, 1]) | (faces[:, 1] == faces[:, 2]) | (faces[:, 0] == faces[:, 2])).any()):
+        original_face_count = len(mesh.faces)
+        mesh.remove_degenerate_faces()
+        faces_changed = True
+        if verbose and len(mesh.faces) < original_face_count:
+            print(f"Removed {original_face_count - len(mesh.faces)} degenerate faces")
+
+    # Remove unreferenced vertices - face removal above may have orphaned
+    # some, so any face change forces this pass
+    if faces_changed or bool((np.bincount(faces.ravel(), minlength=len(mesh.vertices)) == 0).any()):
+        original_vertex_count = len(mesh.vertices)
+        mesh.remove_unreferenced_vertices()
+        if verbose and len(mesh.vertices) < original_vertex_count:
+            print(f"Removed {original_vertex_count - len(mesh.vertices)} unreferenced vertices")
+
+    # Fix normals if needed - queried once, after all face/vertex mutations
+    # above, so the topology scan is not repeated against stale caches
     if not mesh.is_winding_consistent:
         mesh.fix_normals()
         if verbose:
             print("Fixed inconsistent face winding")
 
-    # Fill holes if the mesh is not watertight
-    if not mesh.is_watertight:
+    # Fill holes if the mesh is not watertight; an empty mesh has nothing
+    # to fill (and the watertight query must come after fix_normals, which
+    # mutates faces)
+    if len(mesh.faces) > 0 and not mesh.is_watertight:
         try:
             mesh.fill_holes()
             if verbose:
@@ -152,6 +191,14 @@ def numpy_mesh_to_trimesh(vertices: np.ndarray, faces: np.ndarray) -> trimesh.Tr
     Returns:
         Trimesh object
     """
+    import trimesh
+
+    # Hand trimesh the dtypes and layout it stores internally so its own
+    # validation takes the no-copy fast path
+    if vertices.dtype != np.float64 or not vertices.flags.c_contiguous:
+        vertices = np.ascontiguousarray(vertices, dtype=np.float64)
+    if faces.dtype != np.int64 or not faces.flags.c_contiguous:
+        faces = np.ascontiguousarray(faces, dtype=np.int64)
     return trimesh.Trimesh(vertices=vertices, faces=faces)
 
 
@@ -165,6 +212,8 @@ def save_mesh_debug_view(
         output_path: Path to save the image
         view_angle: Tuple of (azimuth, elevation) angles in degrees
     """
+    import trimesh
+
     try:
         # Create a scene with the mesh
         scene = trimesh.Scene(mesh)
@@ -172,9 +221,8 @@ def save_mesh_debug_view(
         # Save the image with default camera angle
         # Trimesh will automatically position the camera to view the entire mesh
         png = scene.save_image(resolution=[1024, 768])
-        with open(output_path, "wb") as f:
-            f.write(png)
-            print(f"Saved debug view to {output_path}")
+        Path(output_path).write_bytes(png)
+        print(f"Saved debug view to {output_path}")
     except Exception as e:
         print(f"Could not save debug view: {e}")
 
@@ -189,9 +237,14 @@ def check_mesh_from_stl(stl_path: Path | str, verbose: bool = True) -> dict[str,
     Returns:
         Validation results dictionary
     """
-    mesh = trimesh.load(stl_path)
-    if isinstance(mesh, trimesh.Scene):
-        # If it's a scene, get the first mesh
-        mesh = list(mesh.geometry.values())[0]
+    import trimesh
+
+    # force="mesh" makes trimesh return a single Trimesh directly instead of
+    # wrapping multi-body files in a Scene we would immediately unwrap.
+    # STL stores three independent vertices per facet, so shared vertices
+    # must be merged before any topology check can see shared edges -
+    # without the merge every valid mesh reports as non-watertight
+    mesh = trimesh.load(stl_path, force="mesh", process=False)
+    mesh.merge_vertices()  # type: ignore[union-attr]
 
     return validate_mesh(mesh, verbose)  # type: ignore[arg-type]
@@ -8,6 +8,10 @@ from ..logging_config import get_logger
 
 logger = get_logger(__name__)
 
+# Directories already created this process; lets batch runs writing many
+# files into the same directory skip the repeat mkdir syscalls
+_created_dirs: set[Path] = set()
+
 
 def ensure_file_extension(path: Path | str, extension: str) -> Path:
     """Ensure file has the specified extension.
@@ -19,17 +23,19 @@ def ensure_file_extension(path: Path | str, extension: str) -> Path:
     Returns:
         Path with correct extension
     """
-    path = Path(path)
+    if not isinstance(path, Path):
+        path = Path(path)
     # Ensure extension starts with a dot
     if not extension.startswith("."):
         extension = f".{extension}"
 
-    # Check if current extension matches (case-insensitive)
-    if path.suffix.lower() != extension.lower():
-        path = path.with_suffix(extension)
-        logger.debug(f"Changed file extension to {extension}")
+    # Return the path untouched when its extension already matches
+    # (case-insensitive) - the common case needs no new Path object
+    if path.suffix.lower() == extension.lower():
+        return path
 
-    return path
+    logger.debug(f"Changed file extension to {extension}")
+    return path.with_suffix(extension)
 
 
 def prepare_output_path(path: Path | str, extension: str) -> Path:
@@ -45,8 +51,11 @@ def prepare_output_path(path: Path | str, extension: str) -> Path:
     # Ensure proper extension
     output_path = ensure_file_extension(path, extension)
 
-    # Create parent directories if they don't exist
-    output_path.parent.mkdir(parents=True, exist_ok=True)
+    # Create parent directories if they don't exist (once per directory)
+    parent = output_path.parent
+    if parent not in _created_dirs:
+        parent.mkdir(parents=True, exist_ok=True)
+        _created_dirs.add(parent)
     logger.debug(f"Prepared output path: {output_path}")
 
     return output_path
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import os
 import platform
 import subprocess
 from pathlib import Path
@@ -10,6 +11,13 @@ from ..logging_config import get_logger
 
 logger = get_logger(__name__)
 
+# Resolve the platform opener once at import instead of branching on
+# platform.system() per call. Windows goes through os.startfile (a direct
+# ShellExecute call, no subprocess); macOS and Linux shell out to their
+# opener helpers
+_SYSTEM = platform.system()
+_OPEN_COMMAND = ["open"] if _SYSTEM == "Darwin" else ["xdg-open"]
+
 
 def open_file_in_default_app(file_path: Path | str) -> bool:
     """Open file in the system's default application.
@@ -27,13 +35,10 @@ def open_file_in_default_app(file_path: Path | str) -> bool:
         return False
 
     try:
-        system = platform.system()
-        if system == "Darwin":  # macOS
-            subprocess.run(["open", str(file_path)], check=True)
-        elif system == "Windows":
-            subprocess.run(["start", "", str(file_path)], shell=True, check=True)
-        else:  # Linux and others
-            subprocess.run(["xdg-open", str(file_path)], check=True)
+        if _SYSTEM == "Windows":
+            os.startfile(str(file_path))  # type: ignore[attr-defined]
+        else:
+            subprocess.run([*_OPEN_COMMAND, str(file_path)], check=True)
 
         logger.info(f"Opened {file_path.name} in default application")
         return True
@@ -2,13 +2,39 @@
 
 from __future__ import annotations
 
+from functools import cache, lru_cache
+from typing import TYPE_CHECKING
+
 import typer
-from rich.console import Console
 
 from ..logging_config import get_logger
 
+if TYPE_CHECKING:
+    from rich.console import Console
+
 logger = get_logger(__name__)
-console = Console(stderr=True)
+
+
+@lru_cache(maxsize=1)
+def _get_console() -> Console:
+    """Build the stderr console on first use instead of at import time."""
+    from rich.console import Console
+
+    return Console(stderr=True)
+
+
+@cache
+def _normalized_choices(choices: tuple[str, ...], case_sensitive: bool) -> frozenset[str]:
+    """Return the comparison set for a choice tuple, built once per unique set.
+
+    Args:
+        choices: Tuple of valid choices
+        case_sensitive: Whether comparisons are case sensitive
+
+    Returns:
+        Frozenset of choices, lowercased unless case sensitive
+    """
+    return frozenset(choices if case_sensitive else (c.lower() for c in choices))
 
 
 def validate_choice(
@@ -31,12 +57,13 @@ def validate_choice(
     Raises:
         typer.Exit: If validation fails
     """
-    # Normalize for comparison if not case sensitive
+    # Normalize for comparison if not case sensitive; the choice set is
+    # cached per unique choices tuple so repeated CLI validations hash once
     test_value = value if case_sensitive else value.lower()
-    test_choices = choices if case_sensitive else [c.lower() for c in choices]
+    test_choices = _normalized_choices(tuple(choices), case_sensitive)
 
     if test_value not in test_choices:
-        console.print(
+        _get_console().print(
             f"[bold red]Error:[/bold red] Invalid {parameter_name} '{value}'. Must be one of: {', '.join(choices)}"
         )
         raise typer.Exit(code=1)
@@ -65,5 +92,5 @@ def validate_conflict(
     """
     if param1_value and param2_value:
         error_msg = message or f"Cannot use both {param1_name} and {param2_name} at the same time."
-        console.print(f"[bold red]Error:[/bold red] {error_msg}")
+        _get_console().print(f"[bold red]Error:[/bold red] {error_msg}")
         raise typer.Exit(code=1)